@@ -6,6 +6,7 @@ Handles working memory updates via the set_active_thoughts native tool.
 import json
 from typing import Optional
 
+import config
 from agency.commands.handlers.base import CommandHandler, CommandResult
 from agency.commands.errors import ToolError, ToolErrorType
 from core.logger import log_info
@@ -97,6 +98,9 @@ class SetThoughtsHandler(CommandHandler):
 
     def _emit_to_dev_window(self, thoughts: list) -> None:
         """Emit update to dev window if active."""
+        if not config.DEV_MODE_ENABLED:
+            return
+
         try:
             from interface.dev_events import emit_active_thoughts_update
             emit_active_thoughts_update(thoughts)
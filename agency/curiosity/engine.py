@@ -3,6 +3,7 @@ Pattern Project - Curiosity Engine
 Orchestrates the curiosity system components.
 """
 
+from itertools import islice
 from typing import Optional
 
 from agency.curiosity.analyzer import get_curiosity_analyzer, CuriosityAnalyzer, CuriosityCandidate
@@ -207,7 +208,7 @@ class CuriosityEngine:
 
             # Get cooldowns
             excluded = self._ledger.get_excluded_memory_ids()
-            cooldown_dicts = [{"memory_id": mid, "expires_at": "in cooldown"} for mid in list(excluded)[:10]]
+            cooldown_dicts = [{"memory_id": mid, "expires_at": "in cooldown"} for mid in islice(excluded, 10)]
 
             emit_curiosity_update(
                 current_goal=goal_dict,
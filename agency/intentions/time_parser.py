@@ -123,23 +123,23 @@ def format_trigger_time(trigger_at: Optional[datetime], trigger_type: str, now:
     if now is None:
         now = datetime.now()
 
-    delta = trigger_at - now
+    seconds = (trigger_at - now).total_seconds()
 
-    if delta.total_seconds() < 0:
+    if seconds < 0:
         return "overdue"
 
-    if delta.total_seconds() < 60:
+    if seconds < 60:
         return "in less than a minute"
 
-    if delta.total_seconds() < 3600:
-        minutes = int(delta.total_seconds() / 60)
+    if seconds < 3600:
+        minutes = int(seconds / 60)
         return f"in {minutes} minute{'s' if minutes != 1 else ''}"
 
-    if delta.total_seconds() < 86400:
-        hours = int(delta.total_seconds() / 3600)
+    if seconds < 86400:
+        hours = int(seconds / 3600)
         return f"in {hours} hour{'s' if hours != 1 else ''}"
 
-    days = int(delta.total_seconds() / 86400)
+    days = int(seconds / 86400)
     if days == 1:
         return "tomorrow"
     return f"in {days} days"
@@ -159,20 +159,20 @@ def format_relative_past(dt: datetime, now: Optional[datetime] = None) -> str:
     if now is None:
         now = datetime.now()
 
-    delta = now - dt
+    seconds = (now - dt).total_seconds()
 
-    if delta.total_seconds() < 60:
+    if seconds < 60:
         return "just now"
 
-    if delta.total_seconds() < 3600:
-        minutes = int(delta.total_seconds() / 60)
+    if seconds < 3600:
+        minutes = int(seconds / 60)
         return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
 
-    if delta.total_seconds() < 86400:
-        hours = int(delta.total_seconds() / 3600)
+    if seconds < 86400:
+        hours = int(seconds / 3600)
         return f"{hours} hour{'s' if hours != 1 else ''} ago"
 
-    days = int(delta.total_seconds() / 86400)
+    days = int(seconds / 86400)
     if days == 1:
         return "yesterday"
     return f"{days} days ago"
@@ -236,7 +236,7 @@ def run_delegated_task(
     router = get_llm_router()
 
     log_info(f"Delegation started: {task[:80]}... (max {max_rounds} rounds)", prefix="🤖")
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     # Emit delegation start to process panel
     event_bus = get_process_event_bus()
@@ -277,7 +277,7 @@ def run_delegated_task(
 
             # If no tool calls, we're done
             if not response.has_tool_calls():
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 log_info(
                     f"Delegation complete: {round_num} round(s), "
                     f"{duration_ms:.0f}ms, "
@@ -350,7 +350,7 @@ def run_delegated_task(
 
             # If delegate reported its result, we're done
             if report_received:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 log_info(
                     f"Delegation complete (reported): {round_num} round(s), "
                     f"{duration_ms:.0f}ms",
@@ -387,7 +387,7 @@ def run_delegated_task(
             })
 
         # Hit max rounds
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
         log_warning(
             f"Delegation hit max rounds ({max_rounds}), "
             f"{duration_ms:.0f}ms",
@@ -364,7 +364,7 @@ class ToolResponseHelper:
         pulse_interval_changed = False
         clarification_requested = False
         clarification_data = None
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Accumulate text across all passes to preserve original streamed text
         # This fixes a bug where text from early passes was lost if later
@@ -451,7 +451,7 @@ class ToolResponseHelper:
                     passes_executed=pass_num,
                     telegram_sent=telegram_sent,
                     pulse_interval_changed=pulse_interval_changed,
-                    total_duration_ms=(time.time() - start_time) * 1000,
+                    total_duration_ms=(time.perf_counter_ns() - start_time) / 1_000_000,
                     clarification_requested=clarification_requested,
                     clarification_data=clarification_data
                 )
@@ -497,7 +497,7 @@ class ToolResponseHelper:
             )
 
             # Get next response with tools
-            cont_start = time.time()
+            cont_start = time.perf_counter_ns()
             continuation = self._router.chat(
                 messages=current_history,
                 system_prompt=self._system_prompt,
@@ -507,7 +507,7 @@ class ToolResponseHelper:
                 thinking_enabled=self._thinking_enabled,
                 thinking_budget_tokens=self._thinking_budget_tokens
             )
-            current_duration = (time.time() - cont_start) * 1000
+            current_duration = (time.perf_counter_ns() - cont_start) / 1_000_000
 
             # Record continuation response for prompt export
             if self._round_recorder and continuation.success:
@@ -555,7 +555,7 @@ class ToolResponseHelper:
                     passes_executed=pass_num,
                     telegram_sent=telegram_sent,
                     pulse_interval_changed=pulse_interval_changed,
-                    total_duration_ms=(time.time() - start_time) * 1000,
+                    total_duration_ms=(time.perf_counter_ns() - start_time) / 1_000_000,
                     clarification_requested=clarification_requested,
                     clarification_data=clarification_data
                 )
@@ -580,7 +580,7 @@ class ToolResponseHelper:
             passes_executed=max_passes,
             telegram_sent=telegram_sent,
             pulse_interval_changed=pulse_interval_changed,
-            total_duration_ms=(time.time() - start_time) * 1000,
+            total_duration_ms=(time.perf_counter_ns() - start_time) / 1_000_000,
             clarification_requested=clarification_requested,
             clarification_data=clarification_data
         )
@@ -594,33 +594,37 @@ class ToolResponseHelper:
         duration_ms: float
     ):
         """Emit events to dev window if callbacks provided."""
+        from interface.dev_events import dev_emit_batch
+
         emit_pass = callbacks.get("emit_response_pass")
         emit_cmd = callbacks.get("emit_command_executed")
 
-        if emit_pass:
-            tool_names = [tc.name for tc in response.tool_calls] if response.has_tool_calls() else []
-            emit_pass(
-                pass_number=pass_num,
-                provider=response.provider.value if pass_num == 1 else "continuation",
-                response_text=response.text,
-                tokens_in=getattr(response, 'tokens_in', 0) if pass_num == 1 else 0,
-                tokens_out=getattr(response, 'tokens_out', 0) if pass_num == 1 else 0,
-                duration_ms=duration_ms,
-                commands_detected=tool_names,
-                web_searches_used=getattr(response, 'web_searches_used', 0) if pass_num == 1 else 0,
-                citations=getattr(response, 'citations', []) if pass_num == 1 else []
-            )
-
-        if emit_cmd:
-            for result in processed.tool_results:
-                emit_cmd(
-                    command_name=result.tool_name,
-                    query=str(result.content)[:100] if result.content else "",
-                    result_data=result.content,
-                    error=str(result.content) if result.is_error else None,
-                    needs_continuation=True
+        # The pass and its commands share one timestamp
+        with dev_emit_batch():
+            if emit_pass:
+                tool_names = [tc.name for tc in response.tool_calls] if response.has_tool_calls() else []
+                emit_pass(
+                    pass_number=pass_num,
+                    provider=response.provider.value if pass_num == 1 else "continuation",
+                    response_text=response.text,
+                    tokens_in=getattr(response, 'tokens_in', 0) if pass_num == 1 else 0,
+                    tokens_out=getattr(response, 'tokens_out', 0) if pass_num == 1 else 0,
+                    duration_ms=duration_ms,
+                    commands_detected=tool_names,
+                    web_searches_used=getattr(response, 'web_searches_used', 0) if pass_num == 1 else 0,
+                    citations=getattr(response, 'citations', []) if pass_num == 1 else []
                 )
 
+            if emit_cmd:
+                for result in processed.tool_results:
+                    emit_cmd(
+                        command_name=result.tool_name,
+                        query=str(result.content)[:100] if result.content else "",
+                        result_data=result.content,
+                        error=str(result.content) if result.is_error else None,
+                        needs_continuation=True
+                    )
+
 
 def process_with_tools(
     llm_router,
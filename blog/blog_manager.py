@@ -114,16 +114,18 @@ def _sanitize_html(html: str) -> str:
         if closing_slash:
             return f"</{tag_name}>"
 
-        allowed = _ALLOWED_ATTRS.get(tag_name, set())
+        # Most tags allow no attributes at all; skip scanning them
+        allowed = _ALLOWED_ATTRS.get(tag_name)
+        if not allowed:
+            return f"<{tag_name}>"
+
         safe_attrs = []
         for attr_match in _ATTR_RE.finditer(attrs_str):
             attr_name = attr_match.group(1).lower()
-            attr_val = attr_match.group(2) or attr_match.group(3) or attr_match.group(4) or ""
-
-            if _EVENT_ATTR_RE.match(attr_name):
-                continue
-            if attr_name not in allowed:
+            # Allowlist lookup first; the regex checks only run on survivors
+            if attr_name not in allowed or _EVENT_ATTR_RE.match(attr_name):
                 continue
+            attr_val = attr_match.group(2) or attr_match.group(3) or attr_match.group(4) or ""
             if attr_name in ("href", "src") and _DANGEROUS_PROTO_RE.match(attr_val):
                 continue
             safe_attrs.append(f'{attr_name}="{attr_val}"')
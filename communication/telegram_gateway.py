@@ -7,6 +7,9 @@ the legacy SMS-via-carrier-gateway approach.
 """
 
 import asyncio
+import threading
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -17,6 +20,17 @@ from telegram.error import TelegramError
 from core.logger import log_info, log_error, log_warning, log_success
 
 
+# Streamed reply batching: the first flush goes out after STREAM_MIN_BATCH
+# chunks, and each later flush waits for STREAM_BATCH_GROWTH times as many,
+# up to STREAM_MAX_BATCH. STREAM_MIN_INTERVAL keeps edits under Telegram's
+# per-chat rate limit.
+STREAM_MIN_BATCH = 1
+STREAM_BATCH_GROWTH = 3.0
+STREAM_MAX_BATCH = 50
+STREAM_MIN_INTERVAL = 1.0
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+
 @dataclass
 class TelegramResult:
     """
@@ -320,6 +334,203 @@ class TelegramGateway:
             log_warning(f"Failed to log communication to database: {e}")
 
 
+class TelegramStreamBuffer:
+    """
+    Mirrors a streaming LLM reply into a single Telegram message.
+
+    Chunks are batched rather than sent one by one: the first flush sends a
+    preview message, later flushes edit it, and each flush waits for a
+    growing number of chunks (see STREAM_* constants) so a long reply costs
+    a handful of HTTP round-trips instead of one per token.
+
+    Preview updates run on the buffer's own event loop thread with its own
+    Bot, so the streaming thread never waits on Telegram. The listener's
+    loop can't be used: it only runs while polling, and polling is paused
+    while a Telegram message is processed. Previews are not written to
+    communication_log; finish() logs the reply actually delivered.
+    """
+
+    def __init__(self, gateway: TelegramGateway):
+        self._gateway = gateway
+        self._parts: list = []
+        self._pending = 0
+        self._batch = float(STREAM_MIN_BATCH)
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+        self._latest: Optional[str] = None  # Newest preview text not yet sent
+        self._update: Optional[Future] = None  # Preview update in flight
+        self._sent_text = ""
+        self._failed = False  # A preview update failed; stop previewing
+        self._stopped = False  # finish()/discard() called; no more updates
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._bot: Optional[Bot] = None
+        self.message_id: Optional[int] = None
+
+    def push(self, chunk: str) -> None:
+        """Add a streamed chunk, flushing when the current batch is full."""
+        self._parts.append(chunk)
+        self._pending += 1
+        if (self._failed
+                or self._pending < self._batch
+                or time.monotonic() - self._last_flush < STREAM_MIN_INTERVAL):
+            return
+        self._flush("".join(self._parts))
+        self._batch = min(STREAM_MAX_BATCH, self._batch * STREAM_BATCH_GROWTH)
+
+    def finish(self, final_text: str) -> TelegramResult:
+        """
+        Deliver the complete reply, replacing the streamed preview if any.
+
+        The preview is edited into the reply when possible. Otherwise (no
+        preview, a failed update, or a reply over Telegram's length limit)
+        the preview is deleted and the reply goes out as a new message, so
+        the chat never shows a stale fragment next to it.
+        """
+        try:
+            self._settle()
+            if (self.message_id is not None and not self._failed
+                    and len(final_text) <= TELEGRAM_MAX_MESSAGE_LENGTH):
+                try:
+                    if final_text != self._sent_text:
+                        self._run(self._bot.edit_message_text(
+                            chat_id=self._gateway.chat_id,
+                            message_id=self.message_id,
+                            text=final_text
+                        ))
+                    self._gateway._log_to_database(
+                        recipient=self._gateway.chat_id,
+                        body=final_text,
+                        status="sent"
+                    )
+                    return TelegramResult(
+                        success=True,
+                        message="Message edited successfully",
+                        chat_id=self._gateway.chat_id,
+                        message_id=self.message_id
+                    )
+                except Exception as e:
+                    log_warning(f"Telegram edit failed: {e}")
+            self._delete_preview()
+        finally:
+            self.close()
+        return self._gateway.send(final_text)
+
+    def discard(self) -> None:
+        """Delete the streamed preview without sending a reply."""
+        try:
+            self._settle()
+            self._delete_preview()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Shut down the buffer's Bot and event loop thread (idempotent)."""
+        with self._lock:
+            self._stopped = True
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._bot.shutdown(), loop).result(timeout=5.0)
+        except Exception:
+            pass  # Ignore shutdown errors
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5.0)
+        if not loop.is_running():
+            loop.close()
+
+    def _flush(self, text: str) -> None:
+        """Queue the text accumulated so far for the preview message."""
+        text = text[:TELEGRAM_MAX_MESSAGE_LENGTH]
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        if not text.strip():
+            return
+
+        with self._lock:
+            if self._stopped:
+                return
+            self._latest = text
+            if self._update is not None:
+                return  # The update in flight picks up the newest text
+            if self._loop is None:
+                self._start_loop()
+            self._update = asyncio.run_coroutine_threadsafe(
+                self._update_preview(), self._loop
+            )
+
+    def _start_loop(self) -> None:
+        """Start the buffer's event loop thread and Bot (caller holds _lock)."""
+        self._loop = asyncio.new_event_loop()
+        # A Bot per loop, as in TelegramGateway.send()'s fallback path
+        self._bot = Bot(token=self._gateway.bot_token)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="telegram-stream", daemon=True
+        )
+        self._thread.start()
+
+    async def _update_preview(self) -> None:
+        """Send or edit the preview until it shows the newest flushed text."""
+        while True:
+            with self._lock:
+                text, self._latest = self._latest, None
+                if text is None or self._failed or self._stopped:
+                    self._update = None
+                    return
+            if text == self._sent_text:
+                continue
+            try:
+                if self.message_id is None:
+                    sent = await self._bot.send_message(
+                        chat_id=self._gateway.chat_id, text=text
+                    )
+                    self.message_id = sent.message_id
+                else:
+                    await self._bot.edit_message_text(
+                        chat_id=self._gateway.chat_id,
+                        message_id=self.message_id,
+                        text=text
+                    )
+                self._sent_text = text
+            except Exception as e:
+                # Stop previewing; finish() will deliver the full reply
+                log_warning(f"Telegram preview update failed: {e}")
+                with self._lock:
+                    self._failed = True
+                    self._update = None
+                return
+
+    def _settle(self) -> None:
+        """Stop further preview updates and wait for one already in flight."""
+        with self._lock:
+            self._stopped = True
+            self._latest = None
+            update = self._update
+        if update is not None:
+            try:
+                update.result(timeout=30.0)
+            except Exception as e:
+                log_warning(f"Telegram preview update did not finish: {e}")
+                self._failed = True
+
+    def _run(self, coro):
+        """Run a coroutine on the buffer's loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout=30.0)
+
+    def _delete_preview(self) -> None:
+        """Delete the preview message, if one was sent."""
+        if self.message_id is None:
+            return
+        try:
+            self._run(self._bot.delete_message(
+                chat_id=self._gateway.chat_id, message_id=self.message_id
+            ))
+        except Exception as e:
+            log_warning(f"Failed to delete Telegram preview: {e}")
+        self.message_id = None
+
+
 # Singleton instance
 _gateway: Optional[TelegramGateway] = None
 
@@ -5,7 +5,7 @@ Timestamped console output with rich formatting + file logging
 
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -74,9 +74,21 @@ def setup_logging(
     return _logger
 
 
+# (whole second, formatted text) of the last console timestamp. Log lines
+# arrive in bursts within the same second, so the text is reused until the
+# second changes. Stored as one tuple so threads always see a matching pair.
+_timestamp_cache = (-1, "")
+
+
 def get_timestamp() -> str:
     """Get formatted timestamp for console output."""
-    return datetime.now().strftime("%H:%M:%S")
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = time.strftime("%H:%M:%S", time.localtime(second))
+        _timestamp_cache = (second, text)
+    return text
 
 
 def log(message: str, level: str = "info", prefix: str = "") -> None:
@@ -495,6 +495,7 @@ def init_temporal_tracker() -> TemporalTracker:
 # --- Output filtering ---
 
 _TEMPORAL_ECHO_RE = re.compile(r'\(Just now\) ?')
+_MULTI_SPACE_RE = re.compile(r'  +')
 
 
 def strip_temporal_echoes(text: str) -> str:
@@ -507,7 +508,7 @@ def strip_temporal_echoes(text: str) -> str:
         return text
     cleaned = _TEMPORAL_ECHO_RE.sub('', text)
     # Collapse any double-spaces left behind
-    cleaned = re.sub(r'  +', ' ', cleaned)
+    cleaned = _MULTI_SPACE_RE.sub(' ', cleaned)
     # Strip leading blank lines that may result from removal at line start
     cleaned = cleaned.lstrip('\n')
     return cleaned
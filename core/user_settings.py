@@ -48,9 +48,13 @@ class UserSettingsManager:
     """
     Manages loading, saving, and accessing user settings.
 
-    Thread-safe singleton that persists settings to JSON.
+    Thread-safe singleton that persists settings to JSON. Changes are
+    written shortly after they are made, so a burst of changes (stepping the
+    font size, flipping toggles) costs one write; flush() forces it out.
     """
 
+    SAVE_DELAY_SECONDS = 0.5
+
     _instance: Optional["UserSettingsManager"] = None
     _lock = threading.Lock()
 
@@ -69,6 +73,8 @@ class UserSettingsManager:
         self._settings_path: Path = config.USER_SETTINGS_PATH
         self._settings: UserSettings = UserSettings()
         self._file_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
 
         # Ensure data directory exists
         self._settings_path.parent.mkdir(parents=True, exist_ok=True)
@@ -165,6 +171,24 @@ class UserSettingsManager:
             except Exception as e:
                 log_error(f"Failed to save settings: {e}")
 
+    def _schedule_save(self) -> None:
+        """Save after SAVE_DELAY_SECONDS unless a save is already pending."""
+        with self._timer_lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write a pending settings change to disk now (e.g. on shutdown)."""
+        with self._timer_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+        self._save()
+
     # -----------------------------------------------------------------
     # Voice pipeline properties
     # -----------------------------------------------------------------
@@ -176,7 +200,7 @@ class UserSettingsManager:
     @voice_pipeline_enabled.setter
     def voice_pipeline_enabled(self, value: bool) -> None:
         self._settings.voice.pipeline_enabled = value
-        self._save()
+        self._schedule_save()
 
     @property
     def tts_enabled(self) -> bool:
@@ -187,7 +211,7 @@ class UserSettingsManager:
     def tts_enabled(self, value: bool) -> None:
         """Set TTS sub-toggle (independent of master)."""
         self._settings.voice.tts_enabled = value
-        self._save()
+        self._schedule_save()
 
     @property
     def stt_enabled(self) -> bool:
@@ -198,7 +222,7 @@ class UserSettingsManager:
     def stt_enabled(self, value: bool) -> None:
         """Set STT sub-toggle."""
         self._settings.voice.stt_enabled = value
-        self._save()
+        self._schedule_save()
 
     @property
     def tts_voice_id(self) -> str:
@@ -209,7 +233,7 @@ class UserSettingsManager:
     def tts_voice_id(self, value: str) -> None:
         """Set the TTS voice ID."""
         self._settings.voice.voice_id = value
-        self._save()
+        self._schedule_save()
 
     @property
     def stt_model_size(self) -> str:
@@ -221,7 +245,7 @@ class UserSettingsManager:
         """Set the STT model size."""
         if value in ('tiny', 'base', 'small'):
             self._settings.voice.stt_model_size = value
-            self._save()
+            self._schedule_save()
 
     # -----------------------------------------------------------------
     # Other settings properties (unchanged)
@@ -235,7 +259,7 @@ class UserSettingsManager:
     def font_size(self, value: int) -> None:
         """Set font size."""
         self._settings.font_size = value
-        self._save()
+        self._schedule_save()
 
     @property
     def conversation_model(self) -> str:
@@ -246,7 +270,7 @@ class UserSettingsManager:
     def conversation_model(self, value: str) -> None:
         """Set the conversation model."""
         self._settings.conversation_model = value
-        self._save()
+        self._schedule_save()
 
     @property
     def thinking_enabled(self) -> bool:
@@ -257,7 +281,7 @@ class UserSettingsManager:
     def thinking_enabled(self, value: bool) -> None:
         """Set extended thinking enabled state."""
         self._settings.thinking_enabled = value
-        self._save()
+        self._schedule_save()
 
     def get_all(self) -> UserSettings:
         """Get a copy of all settings."""
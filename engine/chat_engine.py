@@ -21,13 +21,14 @@ from typing import Callable, Dict, List, Optional
 
 import config
 from core.logger import log_info, log_error, log_warning
-from core.temporal import get_temporal_tracker
+from core.temporal import get_temporal_tracker, strip_temporal_echoes
 from core.user_settings import get_user_settings
 from core.round_recorder import RoundRecorder
 from memory.conversation import get_conversation_manager
-from llm.router import get_llm_router, TaskType
+from llm.router import get_llm_router, TaskType, LLMResponse, LLMProvider
 from prompt_builder import get_prompt_builder
 from agency.tools import get_tool_definitions, process_with_tools
+from agency.intentions import get_reminder_pulse_prompt
 
 from engine.events import EngineEvent, EngineEventType
 
@@ -48,11 +49,18 @@ class ChatEngine:
         self._user_settings = get_user_settings()
         self._round_recorder = RoundRecorder()
 
+        # Tool sets depend only on config flags fixed at startup, so build
+        # them once instead of on every pass
+        self._tools = get_tool_definitions()
+        self._pulse_tools = get_tool_definitions(is_pulse=True)
+
         from llm.retry_manager import get_retry_manager
         self._retry_manager = get_retry_manager()
 
         self._pulse_manager = None
         self._telegram_listener = None
+        self._telegram_gateway = None  # resolved on first send (optional dependency)
+        self._dev_callbacks: Optional[Dict[str, Callable]] = None  # built on first dev-mode pass
 
         # State flags (protected by lock for thread safety)
         self._lock = threading.Lock()
@@ -139,21 +147,168 @@ class ChatEngine:
         if self._telegram_listener:
             self._telegram_listener.resume()
 
-    def _build_dev_callbacks(self) -> Optional[Dict[str, Callable]]:
-        """Build dev mode callbacks for process_with_tools, if dev mode is on."""
+    def _get_telegram_gateway(self):
+        """Return the Telegram gateway, importing and resolving it only once.
+
+        The import stays lazy because python-telegram-bot is optional.
+        """
+        if self._telegram_gateway is None:
+            from communication.telegram_gateway import get_telegram_gateway
+            self._telegram_gateway = get_telegram_gateway()
+        return self._telegram_gateway
+
+    def _create_telegram_stream_buffer(self):
+        """Create a buffer mirroring a streamed reply into Telegram, if usable."""
+        if not config.TELEGRAM_ENABLED:
+            return None
+        try:
+            from communication.telegram_gateway import TelegramStreamBuffer
+            gateway = self._get_telegram_gateway()
+            return TelegramStreamBuffer(gateway) if gateway.is_available() else None
+        except Exception as e:
+            log_warning(f"Telegram streaming unavailable: {e}")
+            return None
+
+    def _get_dev_callbacks(self) -> Optional[Dict[str, Callable]]:
+        """Dev mode callbacks for process_with_tools, if dev mode is on.
+
+        Built once on first use; process_with_tools only reads the dict.
+        """
         if not config.DEV_MODE_ENABLED:
             return None
 
-        def emit_response_pass(**kwargs):
-            self._emit(EngineEventType.DEV_RESPONSE_PASS, **kwargs)
+        if self._dev_callbacks is None:
+            def emit_response_pass(**kwargs):
+                self._emit(EngineEventType.DEV_RESPONSE_PASS, **kwargs)
+
+            def emit_command_executed(**kwargs):
+                self._emit(EngineEventType.DEV_COMMAND_EXECUTED, **kwargs)
+
+            self._dev_callbacks = {
+                "emit_response_pass": emit_response_pass,
+                "emit_command_executed": emit_command_executed
+            }
+        return self._dev_callbacks
+
+    def _stream_response(self, history: list, system_prompt: str, tools: list,
+                         on_chunk: Optional[Callable[[str], None]] = None) -> LLMResponse:
+        """Run one streaming LLM call and return it as an LLMResponse.
+
+        Text chunks are emitted as STREAM_CHUNK events while they arrive, so
+        background sources (reminder, Telegram) render progressively the same
+        way user messages do. The returned response can be handed straight
+        to process_with_tools().
+
+        on_chunk, if given, also receives each text chunk (e.g. to mirror the
+        reply into Telegram while it streams).
+        """
+        final_state = None
+        for chunk, state in self._llm_router.chat_stream(
+            messages=history,
+            system_prompt=system_prompt,
+            task_type=TaskType.CONVERSATION,
+            temperature=0.7,
+            tools=tools,
+            thinking_enabled=True
+        ):
+            final_state = state
+            if chunk:
+                self._emit(EngineEventType.STREAM_CHUNK, text=chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+
+        if final_state is None:
+            return LLMResponse(text="", success=False, provider=LLMProvider.ANTHROPIC,
+                               error="No response received")
+
+        if final_state.stop_reason == "error":
+            return LLMResponse(
+                text="",
+                success=False,
+                provider=LLMProvider.ANTHROPIC,
+                error=getattr(final_state, '_error_message', 'unknown error'),
+                error_type=getattr(final_state, '_error_type', None)
+            )
+
+        self._emit(EngineEventType.STREAM_COMPLETE,
+                   text=final_state.text,
+                   tokens_in=final_state.input_tokens,
+                   tokens_out=final_state.output_tokens,
+                   stop_reason=final_state.stop_reason or "")
+
+        return LLMResponse(
+            text=final_state.text,
+            success=True,
+            provider=LLMProvider.ANTHROPIC,
+            tokens_in=final_state.input_tokens,
+            tokens_out=final_state.output_tokens,
+            stop_reason=final_state.stop_reason,
+            tool_calls=final_state.tool_calls,
+            raw_content=final_state.raw_content,
+            web_searches_used=final_state.web_searches_used,
+            citations=final_state.citations,
+            server_tool_details=final_state.server_tool_details,
+            thinking_text=final_state.thinking_text
+        )
+
+    def _run_conversation_pass(self, user_message: dict, assembled, source: str,
+                               on_chunk: Optional[Callable[[str], None]] = None):
+        """Run one streamed conversation turn for a background source.
+
+        Shared by reminders and Telegram: appends the user message to the
+        history, streams the LLM call, runs tool passes, stores the reply
+        and emits RESPONSE_COMPLETE.
+
+        Args:
+            user_message: Fully built user message (memories already injected)
+            assembled: AssembledPrompt for this turn
+            source: Source tag for RESPONSE_COMPLETE ("reminder", "telegram")
+            on_chunk: Optional callback for each streamed text chunk
+
+        Returns:
+            (response, result) where result is None if the LLM call failed
+        """
+        history = self._conversation_mgr.get_api_messages()
+        self._mark_history_cache_breakpoint(user_message)
+        history.append(user_message)
 
-        def emit_command_executed(**kwargs):
-            self._emit(EngineEventType.DEV_COMMAND_EXECUTED, **kwargs)
+        # Signal round start so the web process panel creates a round group
+        self._emit(EngineEventType.STREAM_START)
 
-        return {
-            "emit_response_pass": emit_response_pass,
-            "emit_command_executed": emit_command_executed
-        }
+        # LLM call (streamed so the reply renders as it is generated)
+        response = self._stream_response(
+            history, assembled.full_system_prompt, self._tools, on_chunk=on_chunk)
+        if not response.success:
+            return response, None
+
+        result = process_with_tools(
+            llm_router=self._llm_router,
+            response=response,
+            history=history,
+            system_prompt=assembled.full_system_prompt,
+            max_passes=getattr(config, 'COMMAND_MAX_PASSES', 40),
+            pulse_callback=self._on_pulse_interval_change,
+            tools=self._tools,
+            dev_mode_callbacks=self._get_dev_callbacks(),
+            thinking_enabled=True
+        )
+
+        self._conversation_mgr.add_turn(
+            role="assistant",
+            content=result.final_text,
+            input_type="text"
+        )
+
+        self._emit(EngineEventType.RESPONSE_COMPLETE,
+                   text=result.final_text, source=source,
+                   provider=result.final_provider,
+                   telegram_sent=result.telegram_sent)
+
+        if result.clarification_requested and result.clarification_data:
+            self._emit(EngineEventType.CLARIFICATION_REQUESTED,
+                       data=result.clarification_data, source=source)
+
+        return response, result
 
     def _on_pulse_interval_change(self, change_info):
         """Handle pulse interval change from AI tool call."""
@@ -161,26 +316,59 @@ class ChatEngine:
             return
         pt = change_info.get("pulse_type", "")
         secs = change_info.get("interval_seconds", 0)
+        # The pulse manager's setters log the change themselves; only log
+        # here when there is no manager to apply it
         if self._pulse_manager:
             if pt == "reflective":
                 self._pulse_manager.set_reflective_interval(secs)
             elif pt == "action":
                 self._pulse_manager.set_action_interval(secs)
-        log_info(f"{pt} pulse interval changed to {secs}s", prefix="⏱️")
+        else:
+            log_info(f"{pt} pulse interval changed to {secs}s", prefix="⏱️")
         self._emit(EngineEventType.PULSE_INTERVAL_CHANGED,
                    pulse_type=pt, interval_seconds=secs)
 
     def _inject_memories(self, user_message: dict, relevant_memories: Optional[str]):
-        """Inject relevant memories into a user message (API-only, not stored)."""
+        """Inject relevant memories into a user message (API-only, not stored).
+
+        Memories go in as their own text block ahead of the user's text
+        rather than being concatenated onto it, so the (possibly large)
+        memory string is never copied and the user's text block is left
+        untouched.
+        """
         if not relevant_memories:
             return
+        memory_block = {"type": "text", "text": relevant_memories}
         content = user_message.get("content")
         if isinstance(content, str):
-            user_message["content"] = f"{relevant_memories}\n\n{content}"
+            user_message["content"] = [memory_block, {"type": "text", "text": content}]
         elif isinstance(content, list):
-            for block in content:
+            # Keep images first (see build_multimodal_content): place the
+            # memories immediately before the first text block.
+            for i, block in enumerate(content):
                 if isinstance(block, dict) and block.get("type") == "text":
-                    block["text"] = f"{relevant_memories}\n\n{block.get('text', '')}"
+                    content.insert(i, memory_block)
+                    break
+            else:
+                content.append(memory_block)
+
+    def _mark_history_cache_breakpoint(self, user_message: dict):
+        """Mark the newest user message as a prompt-cache breakpoint.
+
+        The pulse paths already do this inline: with the marker on the last
+        message, every tool continuation round within the pass re-reads the
+        conversation prefix from cache instead of prefilling it again.
+        """
+        if not config.PROMPT_CACHE_ENABLED:
+            return
+        content = user_message.get("content")
+        if isinstance(content, str):
+            user_message["content"] = [{"type": "text", "text": content,
+                                        "cache_control": {"type": "ephemeral"}}]
+        elif isinstance(content, list):
+            for block in reversed(content):
+                if isinstance(block, dict) and block.get("type") == "text":
+                    block["cache_control"] = {"type": "ephemeral"}
                     break
 
     def _inject_memory_images(self, user_message: dict, memory_images: list):
@@ -438,7 +626,7 @@ class ChatEngine:
             log_info(f"History now has {len(history)} messages", prefix="📨")
 
             # Get tools
-            tools = get_tool_definitions()
+            tools = self._tools
             log_info(f"Got {len(tools)} tool definitions", prefix="📨")
 
             # Start streaming
@@ -480,7 +668,7 @@ class ChatEngine:
             if final_state is None:
                 log_error("final_state is None - streaming yielded nothing!", prefix="📨")
                 self._emit(EngineEventType.PROCESSING_ERROR,
-                           error="No response received", error_type=None)
+                           error="No response received", error_type=None, source="user")
                 return
 
             if final_state.stop_reason == "error":
@@ -491,10 +679,10 @@ class ChatEngine:
                 if error_type == "both_models_unavailable":
                     self.schedule_retry(user_input, source="user")
                     self._emit(EngineEventType.PROCESSING_ERROR,
-                               error=error_msg, error_type="both_models_unavailable")
+                               error=error_msg, error_type="both_models_unavailable", source="user")
                 else:
                     self._emit(EngineEventType.PROCESSING_ERROR,
-                               error=error_msg, error_type=error_type)
+                               error=error_msg, error_type=error_type, source="user")
                 return
 
             log_info(f"Streaming completed: {len(final_state.text)} chars, stop_reason={final_state.stop_reason}", prefix="📨")
@@ -537,8 +725,6 @@ class ChatEngine:
 
             # Check for tool calls and process them
             if final_state.has_tool_calls():
-                from llm.router import LLMResponse, LLMProvider
-
                 response = LLMResponse(
                     text=final_state.text,
                     success=True,
@@ -564,7 +750,7 @@ class ChatEngine:
                     max_passes=max_passes,
                     pulse_callback=self._on_pulse_interval_change,
                     tools=tools,
-                    dev_mode_callbacks=self._build_dev_callbacks(),
+                    dev_mode_callbacks=self._get_dev_callbacks(),
                     thinking_enabled=True,
                     round_recorder=self._round_recorder
                 )
@@ -574,10 +760,9 @@ class ChatEngine:
                 # Clarification request
                 if result.clarification_requested and result.clarification_data:
                     self._emit(EngineEventType.CLARIFICATION_REQUESTED,
-                               data=result.clarification_data)
+                               data=result.clarification_data, source="user")
 
             # Strip temporal markers the LLM echoed from prompt context
-            from core.temporal import strip_temporal_echoes
             final_text = strip_temporal_echoes(final_text)
 
             # Store response
@@ -600,7 +785,7 @@ class ChatEngine:
             log_error("=== ChatEngine.process_message EXCEPTION ===", prefix="📨")
             log_error(f"Exception: {error_msg}", prefix="📨")
             log_error(f"Traceback:\n{tb}", prefix="📨")
-            self._emit(EngineEventType.PROCESSING_ERROR, error=str(e), error_type=None)
+            self._emit(EngineEventType.PROCESSING_ERROR, error=str(e), error_type=None, source="user")
 
         finally:
             # Clean up temp images from this turn
@@ -681,7 +866,7 @@ class ChatEngine:
                      "cache_control": {"type": "ephemeral"}}
                 ]})
 
-                tools = get_tool_definitions(is_pulse=True, pulse_type=pulse_type)
+                tools = self._pulse_tools
 
                 self._emit(EngineEventType.STREAM_START)
 
@@ -703,7 +888,7 @@ class ChatEngine:
                         max_passes=getattr(config, 'COMMAND_MAX_PASSES', 40),
                         pulse_callback=self._on_pulse_interval_change,
                         tools=tools,
-                        dev_mode_callbacks=self._build_dev_callbacks(),
+                        dev_mode_callbacks=self._get_dev_callbacks(),
                         thinking_enabled=True,
                         task_type=task_type
                     )
@@ -717,14 +902,14 @@ class ChatEngine:
                 else:
                     log_error(f"PULSE: Action pulse API error: {response.error}")
                     self._emit(EngineEventType.PROCESSING_ERROR,
-                               error=response.error, error_type="api_error")
+                               error=response.error, error_type="api_error", source="pulse")
 
         except Exception as e:
             tb = traceback.format_exc()
             log_error(f"PULSE: {label} pulse exception: {e}")
             log_error(f"PULSE: Traceback:\n{tb}")
             self._emit(EngineEventType.PROCESSING_ERROR,
-                       error=str(e), error_type=None)
+                       error=str(e), error_type=None, source="pulse")
 
         finally:
             log_info(f"=== ChatEngine.process_pulse({pulse_type}) completing ===", prefix="⏱️")
@@ -905,7 +1090,7 @@ class ChatEngine:
 
         # Full pulse tool set for presence (growth threads, active thoughts, etc.)
         # Metacognition tools are handled in Phases 1-2 with manual tool lists.
-        presence_tools = get_tool_definitions(is_pulse=True, pulse_type="reflective")
+        presence_tools = self._pulse_tools
 
         self._emit(EngineEventType.STREAM_START)
 
@@ -921,7 +1106,7 @@ class ChatEngine:
         if not response.success:
             log_error(f"PULSE Phase 3 (presence): API error: {response.error}")
             self._emit(EngineEventType.PROCESSING_ERROR,
-                       error=response.error, error_type="api_error")
+                       error=response.error, error_type="api_error", source="pulse")
             return
 
         result = process_with_tools(
@@ -932,7 +1117,7 @@ class ChatEngine:
             max_passes=getattr(config, 'COMMAND_MAX_PASSES', 40),
             pulse_callback=self._on_pulse_interval_change,
             tools=presence_tools,
-            dev_mode_callbacks=self._build_dev_callbacks(),
+            dev_mode_callbacks=self._get_dev_callbacks(),
             thinking_enabled=True,
             task_type=task_type
         )
@@ -957,8 +1142,6 @@ class ChatEngine:
         Args:
             triggered_intentions: List of Intention objects that are due
         """
-        from agency.intentions import get_reminder_pulse_prompt
-
         log_info(f"=== ChatEngine.process_reminder() START ({len(triggered_intentions)} intentions) ===", prefix="⏰")
 
         self._is_processing = True
@@ -997,58 +1180,17 @@ class ChatEngine:
                 system_prompt=""
             )
 
-            history = self._conversation_mgr.get_api_messages()
-            history.append({"role": "user", "content": reminder_prompt})
-
-            tools = get_tool_definitions()
+            user_message = {"role": "user", "content": reminder_prompt}
+            response, result = self._run_conversation_pass(
+                user_message, assembled, source="reminder")
 
-            # Signal round start so the web process panel creates a round group
-            self._emit(EngineEventType.STREAM_START)
-
-            # LLM call
-            response = self._llm_router.chat(
-                messages=history,
-                system_prompt=assembled.full_system_prompt,
-                task_type=TaskType.CONVERSATION,
-                temperature=0.7,
-                tools=tools,
-                thinking_enabled=True
-            )
-
-            if response.success:
-                result = process_with_tools(
-                    llm_router=self._llm_router,
-                    response=response,
-                    history=history,
-                    system_prompt=assembled.full_system_prompt,
-                    max_passes=getattr(config, 'COMMAND_MAX_PASSES', 40),
-                    pulse_callback=self._on_pulse_interval_change,
-                    tools=tools,
-                    dev_mode_callbacks=self._build_dev_callbacks(),
-                    thinking_enabled=True
-                )
-
-                final_text = result.final_text
+            if result is not None:
                 log_info(f"REMINDER: Processed in {result.passes_executed} pass(es)", prefix="⏰")
-
-                self._conversation_mgr.add_turn(
-                    role="assistant",
-                    content=final_text,
-                    input_type="text"
-                )
-
-                self._emit(EngineEventType.RESPONSE_COMPLETE,
-                           text=final_text, source="reminder",
-                           provider=result.final_provider)
-
-                if result.clarification_requested and result.clarification_data:
-                    self._emit(EngineEventType.CLARIFICATION_REQUESTED,
-                               data=result.clarification_data)
             else:
                 error_msg = f"Reminder pulse API error: {response.error}"
                 log_error(f"REMINDER: API call failed - {error_msg}")
                 self._emit(EngineEventType.PROCESSING_ERROR,
-                           error=response.error, error_type="api_error")
+                           error=response.error, error_type="api_error", source="reminder")
 
         except Exception as e:
             error_msg = f"Reminder pulse exception: {str(e)}"
@@ -1056,7 +1198,7 @@ class ChatEngine:
             log_error(f"REMINDER: Exception - {error_msg}")
             log_error(f"REMINDER: Traceback:\n{tb}")
             self._emit(EngineEventType.PROCESSING_ERROR,
-                       error=str(e), error_type=None)
+                       error=str(e), error_type=None, source="reminder")
 
         finally:
             log_info("=== ChatEngine.process_reminder() completing ===", prefix="⏰")
@@ -1087,6 +1229,7 @@ class ChatEngine:
                    text=message.text,
                    from_user=getattr(message, 'from_user', '') or '')
 
+        stream_buffer = None
         try:
             self._pause_timers()
             self._emit(EngineEventType.STATUS_UPDATE,
@@ -1105,8 +1248,6 @@ class ChatEngine:
                 system_prompt=""
             )
 
-            history = self._conversation_mgr.get_api_messages()
-
             # Build user message - include Telegram image if present
             if hasattr(message, 'image') and message.image:
                 user_message = self._build_telegram_image_message(
@@ -1126,59 +1267,32 @@ class ChatEngine:
             if memory_images:
                 self._inject_memory_images(user_message, memory_images)
 
-            history.append(user_message)
-
-            tools = get_tool_definitions()
-
-            # LLM call (non-streaming for Telegram)
             self._emit(EngineEventType.STATUS_UPDATE,
                        text="Responding to Telegram...", type="thinking")
-            response = self._llm_router.chat(
-                messages=history,
-                system_prompt=assembled.full_system_prompt,
-                task_type=TaskType.CONVERSATION,
-                temperature=0.7,
-                tools=tools,
-                thinking_enabled=True
-            )
-
-            if response.success:
-                result = process_with_tools(
-                    llm_router=self._llm_router,
-                    response=response,
-                    history=history,
-                    system_prompt=assembled.full_system_prompt,
-                    max_passes=getattr(config, 'COMMAND_MAX_PASSES', 40),
-                    pulse_callback=self._on_pulse_interval_change,
-                    tools=tools,
-                    dev_mode_callbacks=self._build_dev_callbacks(),
-                    thinking_enabled=True
-                )
+            stream_buffer = self._create_telegram_stream_buffer()
+            response, result = self._run_conversation_pass(
+                user_message, assembled, source="telegram",
+                on_chunk=stream_buffer.push if stream_buffer else None)
 
+            if result is not None:
                 final_text = result.final_text
                 telegram_sent = result.telegram_sent
 
-                # Store response
-                self._conversation_mgr.add_turn(
-                    role="assistant",
-                    content=final_text,
-                    input_type="text"
-                )
-
-                self._emit(EngineEventType.RESPONSE_COMPLETE,
-                           text=final_text, source="telegram",
-                           provider=result.final_provider,
-                           telegram_sent=telegram_sent)
-
-                if result.clarification_requested and result.clarification_data:
-                    self._emit(EngineEventType.CLARIFICATION_REQUESTED,
-                               data=result.clarification_data)
-
-                # Send response back to Telegram (only if not already sent via tool)
-                if config.TELEGRAM_ENABLED and not telegram_sent:
+                # Send response back to Telegram, unless a tool already sent
+                # one; a streamed preview is then dropped rather than turned
+                # into a second copy of the reply.
+                if stream_buffer is not None and telegram_sent:
+                    stream_buffer.discard()
+                elif stream_buffer is not None:
+                    try:
+                        if stream_buffer.finish(final_text).success:
+                            log_info("Telegram response sent successfully", prefix="📱")
+                            self._emit(EngineEventType.TELEGRAM_SENT, text=final_text)
+                    except Exception as e:
+                        log_warning(f"Failed to send response to Telegram: {e}")
+                elif config.TELEGRAM_ENABLED and not telegram_sent:
                     try:
-                        from communication.telegram_gateway import get_telegram_gateway
-                        gateway = get_telegram_gateway()
+                        gateway = self._get_telegram_gateway()
                         if gateway.is_available():
                             gateway.send(final_text)
                             log_info("Telegram response sent successfully", prefix="📱")
@@ -1188,24 +1302,25 @@ class ChatEngine:
                     except Exception as e:
                         log_warning(f"Failed to send response to Telegram: {e}")
             else:
+                if stream_buffer is not None:
+                    stream_buffer.discard()
                 error_type = getattr(response, 'error_type', None)
                 if error_type == "both_models_unavailable":
                     self.schedule_retry(message.text, source="telegram")
                     self._emit(EngineEventType.PROCESSING_ERROR,
                                error=response.error,
-                               error_type="both_models_unavailable")
+                               error_type="both_models_unavailable", source="telegram")
                     # Notify via Telegram
                     try:
                         if config.TELEGRAM_ENABLED:
-                            from communication.telegram_gateway import get_telegram_gateway
-                            gateway = get_telegram_gateway()
+                            gateway = self._get_telegram_gateway()
                             if gateway.is_available():
                                 gateway.send("\u26a0 Both models are currently unavailable. Will retry in 20 minutes.")
                     except Exception:
                         pass
                 else:
                     self._emit(EngineEventType.PROCESSING_ERROR,
-                               error=response.error, error_type="api_error")
+                               error=response.error, error_type="api_error", source="telegram")
 
         except Exception as e:
             error_msg = f"Telegram message processing error: {str(e)}"
@@ -1213,9 +1328,11 @@ class ChatEngine:
             log_error(f"Exception in process_telegram: {error_msg}")
             log_error(f"Traceback:\n{tb}")
             self._emit(EngineEventType.PROCESSING_ERROR,
-                       error=str(e), error_type=None)
+                       error=str(e), error_type=None, source="telegram")
 
         finally:
+            if stream_buffer is not None:
+                stream_buffer.close()
             # Clean up temp images from this turn
             try:
                 from agency.visual_capture import cleanup_temp_images
@@ -1289,7 +1406,7 @@ class ChatEngine:
                 self._inject_memory_images(user_message, memory_images)
 
             history.append(user_message)
-            tools = get_tool_definitions()
+            tools = self._tools
 
             response = self._llm_router.chat(
                 messages=history,
@@ -1335,8 +1452,7 @@ class ChatEngine:
                 if source == "telegram" and not result.telegram_sent:
                     try:
                         if config.TELEGRAM_ENABLED:
-                            from communication.telegram_gateway import get_telegram_gateway
-                            gateway = get_telegram_gateway()
+                            gateway = self._get_telegram_gateway()
                             if gateway.is_available():
                                 gateway.send(final_text)
                     except Exception as e:
@@ -1352,8 +1468,7 @@ class ChatEngine:
                 if source == "telegram":
                     try:
                         if config.TELEGRAM_ENABLED:
-                            from communication.telegram_gateway import get_telegram_gateway
-                            gateway = get_telegram_gateway()
+                            gateway = self._get_telegram_gateway()
                             if gateway.is_available():
                                 gateway.send("[Retry failed \u2014 models still unavailable]")
                     except Exception:
@@ -24,14 +24,14 @@ class EngineEventType(Enum):
     STREAM_COMPLETE = auto()        # {"text": str, "tokens_in": int, "tokens_out": int, "stop_reason": str}
     RESPONSE_COMPLETE = auto()      # {"text": str, "provider": str, "source": str}
     PROCESSING_COMPLETE = auto()    # {}
-    PROCESSING_ERROR = auto()       # {"error": str, "error_type": str|None}
+    PROCESSING_ERROR = auto()       # {"error": str, "error_type": str|None, "source": str}
 
     # Tool lifecycle
     TOOL_INVOKED = auto()           # {"tool_name": str, "detail": str}
     SERVER_TOOL_INVOKED = auto()    # {"tool_name": str, "detail": str}
 
     # Clarification
-    CLARIFICATION_REQUESTED = auto()  # {"data": dict}  (question, options, context)
+    CLARIFICATION_REQUESTED = auto()  # {"data": dict, "source": str}  (question, options, context)
 
     # Pulse / reminder
     PULSE_FIRED = auto()              # {"pulse_type": "reflective"|"action"}
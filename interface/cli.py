@@ -3,7 +3,9 @@ Pattern Project - CLI Interface
 Rich terminal interface for conversation
 """
 
-import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, Dict, Any
 
 from rich.console import Console
@@ -11,15 +13,54 @@ from rich.prompt import Prompt
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.table import Table
+from rich.text import Text
+from rich.style import Style
 
 import config
 from core.logger import log_error, get_timestamp
 from core.temporal import get_temporal_tracker
 from memory.vector_store import get_vector_store
 from memory.extractor import get_memory_extractor
+from core.database import get_database
 from llm.router import TaskType
 from concurrency.locks import get_lock_manager
 from prompt_builder.sources.core_memory import get_core_memory_source
+from prompt_builder.sources.system_pulse import get_interval_label
+from agency.system_pulse import get_pulse_manager
+from agency.intentions import get_reminder_scheduler
+from engine.events import EngineEventType
+
+
+# Pre-built styles for frequently printed status lines (avoids markup parsing)
+_STYLE_DIM = Style(dim=True)
+_STYLE_CYAN = Style(color="cyan")
+_STYLE_YELLOW = Style(color="yellow")
+_STYLE_RED = Style(color="red")
+_STYLE_CYAN_BOLD = Style(color="cyan", bold=True)
+_STYLE_MAGENTA_BOLD = Style(color="magenta", bold=True)
+_STYLE_YELLOW_BOLD = Style(color="yellow", bold=True)
+_STYLE_RED_BOLD = Style(color="red", bold=True)
+
+# Column layouts (header, style) for tables whose rows change per call
+_STATS_COLUMNS = (("Metric", "cyan"), ("Value", ""))
+_MEMORY_COLUMNS = (("ID", "dim"), ("Type", "cyan"), ("Content", ""), ("Importance", "green"))
+_SEARCH_COLUMNS = (
+    ("Type", "cyan"), ("Content", ""), ("Semantic", "green"),
+    ("Import", "magenta"), ("Fresh", "yellow"), ("Total", "bold green"),
+)
+
+
+def _new_table(title: str, columns) -> Table:
+    """Create an empty table with the given (header, style) columns."""
+    table = Table(title=title, show_header=True)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return f"{text[:limit]}..." if len(text) > limit else text
 
 
 class ChatCLI:
@@ -37,17 +78,73 @@ class ChatCLI:
         self.console = Console()
         self._running = False
         self._lock_manager = get_lock_manager()
+        # Feature flags are fixed once main.py has parsed its arguments
+        self._dev_mode = config.DEV_MODE_ENABLED
+        self._pulse_enabled = config.SYSTEM_PULSE_ENABLED
+        self._telegram_enabled = config.TELEGRAM_ENABLED
+        # Singletons resolved on first use (see the properties below)
+        self._tracker = None
+        self._vector_store = None
+        self._extractor = None
+        self._core_source = None
         self._commands: Dict[str, Callable] = {}
-        self._pulse_queue: queue.Queue = queue.Queue()
-        self._reminder_queue: queue.Queue = queue.Queue()
-        self._telegram_queue: queue.Queue = queue.Queue()
+        # Single-producer/single-consumer handoff from background threads:
+        # deque append/popleft are atomic, and each Event gives the consumer
+        # a lock-free "anything pending?" check.
+        self._pulse_queue: deque = deque()
+        self._pulse_event = threading.Event()
+        self._reminder_queue: deque = deque()
+        self._reminder_event = threading.Event()
+        self._telegram_queue: deque = deque()
+        self._telegram_event = threading.Event()
+        # Any arrival also sets the wake event, which the dispatcher thread
+        # blocks on, so pending work is handed off as soon as it lands
+        # instead of waiting for the next trip around the input loop.
+        self._wake_event = threading.Event()
+        self._dispatcher: Optional[threading.Thread] = None
+        # Background sources (pulse, reminder, Telegram) run on one worker so
+        # the REPL never blocks on their LLM calls; the lock keeps them from
+        # overlapping a user turn inside the engine.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cli-background")
+        self._engine_lock = threading.Lock()
         self._system_pulse_timer = None
         self._reminder_scheduler = None
         self._telegram_listener = None
         self._engine = None  # ChatEngine (set via set_engine)
+        self._last_result: Dict[str, Any] = {}  # User turn results from engine events
         self._is_first_message_of_session = True  # Track for next_session reminder triggers
+        self._help_table: Optional[Table] = None  # Built on first /help
+        self._response_panels: Dict[str, Panel] = {}  # One reusable panel per source
         self._setup_commands()
 
+    @property
+    def tracker(self):
+        """Temporal tracker, fetched once on first use."""
+        if self._tracker is None:
+            self._tracker = get_temporal_tracker()
+        return self._tracker
+
+    @property
+    def vector_store(self):
+        """Vector store, fetched once on first use."""
+        if self._vector_store is None:
+            self._vector_store = get_vector_store()
+        return self._vector_store
+
+    @property
+    def extractor(self):
+        """Memory extractor, fetched once on first use."""
+        if self._extractor is None:
+            self._extractor = get_memory_extractor()
+        return self._extractor
+
+    @property
+    def core_source(self):
+        """Core memory source, fetched once on first use."""
+        if self._core_source is None:
+            self._core_source = get_core_memory_source()
+        return self._core_source
+
     def set_engine(self, engine):
         """Set the ChatEngine instance for message processing."""
         self._engine = engine
@@ -74,22 +171,20 @@ class ChatCLI:
     def start(self) -> None:
         """Start the CLI chat loop."""
         self._running = True
-        tracker = get_temporal_tracker()
+        tracker = self.tracker
 
         # Set up pulse manager if enabled
-        if config.SYSTEM_PULSE_ENABLED:
-            from agency.system_pulse import get_pulse_manager
+        if self._pulse_enabled:
             self._system_pulse_timer = get_pulse_manager()
             self._system_pulse_timer.set_reflective_callback(self._on_pulse_fired)
             self._system_pulse_timer.set_action_callback(self._on_pulse_fired)
 
         # Set up reminder scheduler
-        from agency.intentions import get_reminder_scheduler
         self._reminder_scheduler = get_reminder_scheduler()
         self._reminder_scheduler.set_callback(self._on_reminder_fired)
 
         # Set up Telegram listener if enabled
-        if config.TELEGRAM_ENABLED:
+        if self._telegram_enabled:
             from communication.telegram_listener import get_telegram_listener
             self._telegram_listener = get_telegram_listener()
             self._telegram_listener.set_callback(self._on_telegram_message)
@@ -104,32 +199,31 @@ class ChatCLI:
 
         self.console.print()
         self.console.print(
-            "[bold cyan]💬 Entering chat mode. Type '/help' for commands.[/bold cyan]"
+            Text("💬 Entering chat mode. Type '/help' for commands.", style=_STYLE_CYAN_BOLD)
         )
-        if config.SYSTEM_PULSE_ENABLED:
+        if self._pulse_enabled:
+            self.console.print(Text(
+                f"System pulse active: action every {config.ACTION_PULSE_INTERVAL // 3600}h, "
+                f"reflection every {config.REFLECTIVE_PULSE_INTERVAL // 3600}h",
+                style=_STYLE_DIM
+            ))
+        if self._telegram_enabled:
             self.console.print(
-                f"[dim]System pulse active: action every {config.ACTION_PULSE_INTERVAL // 3600}h, reflection every {config.REFLECTIVE_PULSE_INTERVAL // 3600}h[/dim]"
+                Text("Telegram bidirectional messaging active", style=_STYLE_DIM)
             )
-        if config.TELEGRAM_ENABLED:
+        if self._dev_mode:
             self.console.print(
-                "[dim]Telegram bidirectional messaging active[/dim]"
-            )
-        if config.DEV_MODE_ENABLED:
-            self.console.print(
-                "[bold magenta]🔧 Dev mode active: Showing internal operations[/bold magenta]"
+                Text("🔧 Dev mode active: Showing internal operations", style=_STYLE_MAGENTA_BOLD)
             )
         self.console.print()
 
-        # State for collecting engine results
-        self._last_result = {}
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="cli-dispatcher", daemon=True
+        )
+        self._dispatcher.start()
 
         while self._running:
             try:
-                # Check for pending pulse/reminder/telegram before getting input
-                self._check_pulse_queue()
-                self._check_reminder_queue()
-                self._check_telegram_queue()
-
                 # Get user input
                 user_input = Prompt.ask("[bold green]You[/bold green]")
 
@@ -149,7 +243,8 @@ class ChatCLI:
                 # Process via engine (synchronous — blocks until complete)
                 self._last_result = {}
                 with self.console.status("[bold blue]Thinking...[/bold blue]", spinner="dots"):
-                    self._engine.process_message(user_input)
+                    with self._engine_lock:
+                        self._engine.process_message(user_input)
 
                 # Display the result collected by the event listener
                 if self._last_result.get("error"):
@@ -175,8 +270,36 @@ class ChatCLI:
                 self.console.print(f"[bold red]Error:[/bold red] {e}")
 
     def stop(self) -> None:
-        """Stop the CLI loop."""
+        """Stop the CLI loop.
+
+        Passes still queued for the background worker have not started and
+        are dropped. One already inside the engine is mid-turn, so wait for
+        it to finish rather than abandon it.
+        """
         self._running = False
+        self._wake_event.set()
+        if self._engine_lock.locked():
+            self.console.print("[dim]Waiting for background response to finish...[/dim]")
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _dispatch_loop(self) -> None:
+        """Hand pulses, reminders and Telegram messages to the worker on arrival.
+
+        Sleeps on the wake event rather than polling, so it costs nothing
+        while idle and the blocking input prompt never delays a handoff.
+        """
+        while self._running:
+            self._wake_event.wait()
+            if not self._running:
+                break
+            self._wake_event.clear()
+            try:
+                self._check_pulse_queue()
+                self._check_reminder_queue()
+                self._check_telegram_queue()
+            except RuntimeError:
+                # Worker already shut down by stop()
+                break
 
     def _display_response(
         self,
@@ -189,76 +312,68 @@ class ChatCLI:
 
         if clarification:
             # Special styling for clarification requests
-            question = clarification.get("question", "")
-            options = clarification.get("options", [])
-            context_note = clarification.get("context", "")
-
-            # Build clarification panel content
-            content_parts = []
-            if context_note:
-                content_parts.append(f"[dim italic]{context_note}[/dim italic]")
-                content_parts.append("")
-
-            content_parts.append(f"[bold]{question}[/bold]")
-
-            if options:
-                content_parts.append("")
-                for i, opt in enumerate(options, 1):
-                    content_parts.append(f"  [cyan]{i}.[/cyan] {opt}")
-
-            clarification_panel = Panel(
-                "\n".join(content_parts),
-                title="[bold yellow]Clarification Needed[/bold yellow]",
-                title_align="left",
-                border_style="yellow",
-                padding=(1, 2)
-            )
-            self.console.print(clarification_panel)
+            self._display_clarification_panel(clarification)
 
             # Also show any additional response text (Claude's natural language)
-            if text.strip():
+            stripped = text.strip()
+            if stripped:
                 self.console.print()
-                self.console.print(Markdown(text))
+                self.console.print(Markdown(stripped))
         else:
             # Normal response display
-            panel = Panel(
-                Markdown(text),
-                title=f"[bold blue]AI[/bold blue] [dim]({provider})[/dim]",
-                title_align="left",
-                border_style="blue",
-                padding=(0, 1)
-            )
-            self.console.print(panel)
+            self._print_response_panel("user", text, "AI", provider, "blue", spacer=False)
 
         self.console.print()
 
+    def _print_response_panel(
+        self,
+        source: str,
+        text: str,
+        label: str,
+        provider: str,
+        style: str,
+        spacer: bool = True
+    ) -> None:
+        """Print a response in a bordered panel.
+
+        Each source keeps one Panel whose content and title are swapped per
+        response. Sources are printed from a fixed thread each (user on the
+        REPL, the rest on the background worker), so the panels are never
+        shared across threads.
+        """
+        panel = self._response_panels.get(source)
+        if panel is None:
+            panel = Panel("", title_align="left", padding=(0, 1))
+            self._response_panels[source] = panel
+        panel.renderable = Markdown(text)
+        panel.title = f"[bold {style}]{label}[/bold {style}] [dim]({provider})[/dim]"
+        panel.border_style = style
+        self.console.print(panel)
+        if spacer:
+            self.console.print()
+
     def _display_clarification_panel(self, clarification: Dict[str, Any]) -> None:
         """Display a clarification request panel."""
-        question = clarification.get("question", "")
-        options = clarification.get("options", [])
-        context_note = clarification.get("context", "")
-
-        # Build clarification panel content
-        content_parts = []
-        if context_note:
-            content_parts.append(f"[dim italic]{context_note}[/dim italic]")
-            content_parts.append("")
+        self.console.print(self._build_clarification_panel(clarification))
 
-        content_parts.append(f"[bold]{question}[/bold]")
+    def _build_clarification_panel(self, clarification: Dict[str, Any]) -> Panel:
+        """Build the panel shown for a clarification request."""
+        context_note = clarification.get("context", "")
+        options = clarification.get("options", [])
 
+        lines = [f"[dim italic]{context_note}[/dim italic]", ""] if context_note else []
+        lines.append(f"[bold]{clarification.get('question', '')}[/bold]")
         if options:
-            content_parts.append("")
-            for i, opt in enumerate(options, 1):
-                content_parts.append(f"  [cyan]{i}.[/cyan] {opt}")
+            lines.append("")
+            lines.extend(f"  [cyan]{i}.[/cyan] {opt}" for i, opt in enumerate(options, 1))
 
-        panel = Panel(
-            "\n".join(content_parts),
+        return Panel(
+            "\n".join(lines),
             title="[bold yellow]Clarification Needed[/bold yellow]",
             title_align="left",
             border_style="yellow",
             padding=(1, 2)
         )
-        self.console.print(panel)
 
     def _on_engine_event(self, event):
         """Handle engine events for CLI display.
@@ -267,10 +382,10 @@ class ChatCLI:
         and display after the engine call returns.
 
         For async sources (pulse, reminder, telegram), we display directly
-        since they run in background threads via the queue system.
+        since they run on the background worker, possibly while a user turn
+        is waiting on the engine. Errors and clarifications carry a source
+        so only the user's own reach _last_result.
         """
-        from engine.events import EngineEventType
-
         etype = event.event_type
         data = event.data
 
@@ -285,344 +400,185 @@ class ChatCLI:
                 self._last_result["provider"] = provider
             elif source == "pulse":
                 pulse_type = data.get("pulse_type", "action")
-                panel = Panel(
-                    Markdown(text),
-                    title=f"[bold magenta]AI ({pulse_type} pulse)[/bold magenta] [dim]({provider})[/dim]",
-                    title_align="left",
-                    border_style="magenta",
-                    padding=(0, 1)
+                self._print_response_panel(
+                    source, text, f"AI ({pulse_type} pulse)", provider, "magenta"
                 )
-                self.console.print(panel)
-                self.console.print()
             elif source == "reminder":
-                panel = Panel(
-                    Markdown(text),
-                    title=f"[bold yellow]AI (reminder)[/bold yellow] [dim]({provider})[/dim]",
-                    title_align="left",
-                    border_style="yellow",
-                    padding=(0, 1)
-                )
-                self.console.print(panel)
-                self.console.print()
+                self._print_response_panel(source, text, "AI (reminder)", provider, "yellow")
             elif source == "telegram":
-                panel = Panel(
-                    Markdown(text),
-                    title=f"[bold cyan]AI (telegram)[/bold cyan] [dim]({provider})[/dim]",
-                    title_align="left",
-                    border_style="cyan",
-                    padding=(0, 1)
-                )
-                self.console.print(panel)
-                self.console.print()
+                self._print_response_panel(source, text, "AI (telegram)", provider, "cyan")
             elif source == "retry":
                 original_source = data.get("original_source", "user")
                 style = "cyan" if original_source == "telegram" else "blue"
-                panel = Panel(
-                    Markdown(text),
-                    title=f"[bold {style}]AI (retry)[/bold {style}] [dim]({provider})[/dim]",
-                    title_align="left",
-                    border_style=style,
-                    padding=(0, 1)
-                )
-                self.console.print(panel)
-                self.console.print()
+                self._print_response_panel(source, text, "AI (retry)", provider, style)
 
         elif etype == EngineEventType.PROCESSING_ERROR:
             error = data.get("error", "Unknown error")
-            source = data.get("source", "")
-            # For user messages, collect for synchronous display
-            if not hasattr(self, '_last_result') or self._last_result is None:
-                self._last_result = {}
-            self._last_result["error"] = error
+            source = data.get("source", "user")
+            if source == "user":
+                # Collect for synchronous display
+                self._last_result["error"] = error
+            else:
+                # Background passes share the engine with user turns; never
+                # let their errors land in the user's result
+                self.console.print(Text.assemble(
+                    (f"Error ({source}):", _STYLE_RED_BOLD), f" {error}"
+                ))
 
         elif etype == EngineEventType.CLARIFICATION_REQUESTED:
-            # Collect for synchronous display
-            if hasattr(self, '_last_result'):
+            source = data.get("source", "user")
+            if source == "user":
+                # Collect for synchronous display
                 self._last_result["clarification"] = data.get("data")
+            elif data.get("data"):
+                # Follows the background response panel printed above
+                self._display_clarification_panel(data["data"])
+                self.console.print()
 
         elif etype == EngineEventType.TELEGRAM_RECEIVED:
             from_info = f" from {data.get('from_user', '')}" if data.get('from_user') else ""
             text = data.get("text", "")
             self.console.print()
-            self.console.print(f"[bold cyan]📱 Telegram Message{from_info}[/bold cyan]")
-            self.console.print(f"[dim]{text}[/dim]")
+            self.console.print(Text(f"📱 Telegram Message{from_info}", style=_STYLE_CYAN_BOLD))
+            self.console.print(Text(text, style=_STYLE_DIM))
 
         elif etype == EngineEventType.PULSE_FIRED:
             pulse_type = data.get("pulse_type", "action")
             self.console.print()
-            self.console.print(f"[bold magenta]⏱️ {pulse_type.capitalize()} Pulse[/bold magenta]")
+            self.console.print(Text(f"⏱️ {pulse_type.capitalize()} Pulse", style=_STYLE_MAGENTA_BOLD))
 
         elif etype == EngineEventType.REMINDER_FIRED:
             intentions = data.get("intentions", [])
             self.console.print()
-            self.console.print(f"[bold yellow]⏰ Reminder Triggered ({len(intentions)} intention(s))[/bold yellow]")
+            self.console.print(Text(
+                f"⏰ Reminder Triggered ({len(intentions)} intention(s))", style=_STYLE_YELLOW_BOLD
+            ))
 
         elif etype == EngineEventType.RETRY_FAILED:
             source = data.get("source", "user")
-            self.console.print(f"[bold red]Retry failed ({source}):[/bold red] {data.get('error', 'unknown')}")
-
-    def _display_dev_prompt_assembly(self, assembled) -> None:
-        """Display prompt assembly info in dev mode."""
-        if not config.DEV_MODE_ENABLED:
-            return
-
-        self.console.print()
-        self.console.print("[bold magenta]═══ DEV: Prompt Assembly ═══[/bold magenta]")
-
-        total_tokens = len(assembled.full_system_prompt) // 4  # Rough estimate
-        self.console.print(f"[dim]Estimated tokens: ~{total_tokens}[/dim]")
-
-        for block in sorted(assembled.context_blocks, key=lambda b: b.priority):
-            block_tokens = len(block.content) // 4
-            self.console.print(
-                f"  [cyan]{block.source_name}[/cyan] "
-                f"[dim](priority {block.priority}, ~{block_tokens} tokens)[/dim]"
-            )
-
-        self.console.print()
-
-    def _display_dev_response_pass(self, pass_num: int, provider: str,
-                                    response_text: str, commands: list,
-                                    duration_ms: float = 0) -> None:
-        """Display response pass info in dev mode."""
-        if not config.DEV_MODE_ENABLED:
-            return
-
-        self.console.print(
-            f"[bold magenta]═══ DEV: Pass {pass_num} ({provider}) ═══[/bold magenta]"
-        )
-        if duration_ms > 0:
-            self.console.print(f"[dim]Duration: {duration_ms:.0f}ms[/dim]")
-
-        if commands:
-            cmd_list = ", ".join([f"[[{c}]]" for c in commands])
-            self.console.print(f"[yellow]Commands detected: {cmd_list}[/yellow]")
-
-        # Show truncated response preview
-        preview = response_text[:200]
-        if len(response_text) > 200:
-            preview += "..."
-        self.console.print(f"[dim]Response: {preview}[/dim]")
-        self.console.print()
-
-    def _display_dev_command_execution(self, cmd_name: str, query: str,
-                                        result_data, error: str = None) -> None:
-        """Display command execution info in dev mode."""
-        if not config.DEV_MODE_ENABLED:
-            return
-
-        status = "[green]Success[/green]" if not error else f"[red]Error: {error}[/red]"
-        self.console.print(
-            f"  [yellow][[{cmd_name}: {query[:50]}{'...' if len(query) > 50 else ''}]][/yellow] → {status}"
-        )
-
-    def _process_native_tools_response_cli(
-        self,
-        response,
-        history: list,
-        system_prompt: str,
-        tools: list,
-        max_passes: int,
-        pass1_duration: float,
-        router
-    ) -> tuple:
-        """
-        Process response using native tool use (CLI version).
-
-        DEPRECATED (December 2025): This method is no longer called.
-        Use `process_with_tools` from agency.tools instead.
-        The shared helper provides consistent processing across all entry points.
-        Kept for reference during migration period.
-
-        Returns:
-            Tuple of (final_text, final_provider)
-        """
-        import time
-        from llm.router import TaskType
-        from agency.tools import get_tool_processor
-
-        processor = get_tool_processor()
-        current_response = response
-        current_history = history.copy()
-        current_duration = pass1_duration
-        current_provider = response.provider.value
-
-        for pass_num in range(1, max_passes + 1):
-            # Process response for tool calls
-            processed = processor.process(current_response, context={})
-
-            # Get tool names for dev display
-            tool_names = [tc.name for tc in current_response.tool_calls] if current_response.has_tool_calls() else []
-
-            # Display dev mode info
-            self._display_dev_response_pass(
-                pass_num, current_provider, current_response.text,
-                tool_names, current_duration
-            )
-
-            # Display dev mode tool execution info
-            for result in processed.tool_results:
-                self._display_dev_command_execution(
-                    result.tool_name,
-                    str(result.content)[:100] if result.content else "",
-                    result.content,
-                    str(result.content) if result.is_error else None
-                )
-
-            # If no continuation needed
-            if not processed.needs_continuation:
-                return processed.display_text, current_provider
-
-            # Show status
-            if pass_num == 1:
-                self.console.print("[dim]  ↳ Executing tools...[/dim]")
-            else:
-                self.console.print(f"[dim]  ↳ Executing tools (pass {pass_num})...[/dim]")
-
-            # Build continuation with raw content blocks
-            current_history.append({
-                "role": "assistant",
-                "content": current_response.raw_content
-            })
-
-            # Ensure every tool_use block has a matching tool_result
-            # (server-side tools need synthetic results)
-            from agency.tools.response_helper import ensure_tool_results
-            tool_result_msg = ensure_tool_results(
-                current_response.raw_content,
-                processed.tool_result_message
-            )
-            current_history.append(tool_result_msg)
-
-            # Get next response
-            cont_start = time.time()
-            with self.console.status("[bold blue]Continuing...[/bold blue]", spinner="dots"):
-                from core.user_settings import get_user_settings
-                continuation = router.chat(
-                    messages=current_history,
-                    system_prompt=system_prompt,
-                    task_type=TaskType.CONVERSATION,
-                    temperature=0.7,
-                    tools=tools,
-                    thinking_enabled=True
-                )
-            current_duration = (time.time() - cont_start) * 1000
-
-            if not continuation.success:
-                return processed.display_text, current_provider
-
-            current_response = continuation
-            current_provider = continuation.provider.value
-
-        # Hit max passes
-        return current_response.text, current_provider
+            self.console.print(Text.assemble(
+                (f"Retry failed ({source}):", _STYLE_RED_BOLD), f" {data.get('error', 'unknown')}"
+            ))
 
     def _on_pulse_fired(self) -> None:
         """Called when the system pulse timer fires (from background thread)."""
-        # Queue the pulse for processing in the main loop
-        self._pulse_queue.put(True)
+        # Queue the pulse and wake the dispatcher
+        self._pulse_queue.append(True)
+        self._pulse_event.set()
+        self._wake_event.set()
 
     def _check_pulse_queue(self) -> None:
-        """Check if there's a pending pulse to process."""
-        try:
-            # Non-blocking check
-            self._pulse_queue.get_nowait()
-            # Pulse is pending, process it
-            self._process_pulse()
-        except queue.Empty:
-            pass
+        """Hand any pending pulses to the background worker."""
+        if not self._pulse_event.is_set():
+            return
+        self._pulse_event.clear()
+        while self._pulse_queue:
+            self._pulse_queue.popleft()
+            self._executor.submit(self._process_pulse)
 
     def _process_pulse(self) -> None:
-        """Process a system pulse via engine (defaults to action pulse in CLI)."""
+        """Process a system pulse via engine (defaults to action pulse in CLI).
+
+        Runs on the background worker; the engine's event listener prints the
+        result panel when it completes.
+        """
         if self._engine:
-            with self.console.status("[bold magenta]Pulse thinking...[/bold magenta]", spinner="dots"):
+            with self._engine_lock:
                 self._engine.process_pulse("action")
         else:
             log_error("Engine not available for pulse processing")
 
     def _on_reminder_fired(self, triggered_intentions) -> None:
         """Called when the reminder scheduler detects due intentions (from background thread)."""
-        # Queue the reminder for processing in the main loop
-        self._reminder_queue.put(triggered_intentions)
+        # Queue the reminder and wake the dispatcher
+        self._reminder_queue.append(triggered_intentions)
+        self._reminder_event.set()
+        self._wake_event.set()
 
     def _check_reminder_queue(self) -> None:
-        """Check if there's a pending reminder to process."""
-        try:
-            # Non-blocking check
-            triggered_intentions = self._reminder_queue.get_nowait()
-            # Reminder is pending, process it
-            self._process_reminder(triggered_intentions)
-        except queue.Empty:
-            pass
+        """Hand any pending reminders to the background worker."""
+        if not self._reminder_event.is_set():
+            return
+        self._reminder_event.clear()
+        while self._reminder_queue:
+            triggered_intentions = self._reminder_queue.popleft()
+            self._executor.submit(self._process_reminder, triggered_intentions)
 
     def _process_reminder(self, triggered_intentions) -> None:
-        """Process a reminder pulse via engine."""
+        """Process a reminder pulse via engine (runs on the background worker)."""
         if self._engine:
-            with self.console.status("[bold yellow]Reminder thinking...[/bold yellow]", spinner="dots"):
+            with self._engine_lock:
                 self._engine.process_reminder(triggered_intentions)
         else:
             log_error("Engine not available for reminder processing")
 
     def _on_telegram_message(self, message) -> None:
         """Called when a Telegram message is received (from background thread)."""
-        # Queue the message for processing in the main loop
-        self._telegram_queue.put(message)
+        # Queue the message and wake the dispatcher
+        self._telegram_queue.append(message)
+        self._telegram_event.set()
+        self._wake_event.set()
 
     def _check_telegram_queue(self) -> None:
-        """Check if there's a pending Telegram message to process."""
-        try:
-            # Non-blocking check
-            message = self._telegram_queue.get_nowait()
-            # Message is pending, process it
-            self._process_telegram_message(message)
-        except queue.Empty:
-            pass
+        """Hand any pending Telegram messages to the background worker."""
+        if not self._telegram_event.is_set():
+            return
+        self._telegram_event.clear()
+        while self._telegram_queue:
+            message = self._telegram_queue.popleft()
+            self._executor.submit(self._process_telegram_message, message)
 
     def _process_telegram_message(self, message) -> None:
-        """Process an inbound Telegram message via engine."""
+        """Process an inbound Telegram message via engine (runs on the background worker)."""
         if self._engine:
-            with self.console.status("[bold cyan]Responding to Telegram...[/bold cyan]", spinner="dots"):
+            with self._engine_lock:
                 self._engine.process_telegram(message)
         else:
             log_error("Engine not available for telegram processing")
 
     def _handle_command(self, input_str: str) -> None:
         """Handle a slash command."""
+        # Command names are registered lowercase, so only the name needs
+        # normalizing
         parts = input_str.split(maxsplit=1)
         cmd = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
 
-        if cmd in self._commands:
-            self._commands[cmd](args)
+        handler = self._commands.get(cmd)
+        if handler is not None:
+            handler(args)
         else:
             self.console.print(f"[yellow]Unknown command: {cmd}[/yellow]")
             self.console.print("[dim]Type /help for available commands[/dim]")
 
     def _cmd_help(self, args: str) -> None:
         """Show help."""
-        table = Table(title="Available Commands", show_header=True)
-        table.add_column("Command", style="cyan")
-        table.add_column("Description")
-
-        table.add_row("/help", "Show this help message")
-        table.add_row("/quit, /exit", "Exit the program")
-        table.add_row("/new", "Start a new session")
-        table.add_row("/end", "End the current session")
-        table.add_row("/stats", "Show system statistics")
-        table.add_row("/memories", "Show recent memories")
-        table.add_row("/search <query>", "Search memories")
-        table.add_row("/extract", "Force memory extraction")
-        table.add_row("/core", "Show core memories")
-        table.add_row("/addcore <category> <content>", "Add core memory (identity/relationship/preference/fact)")
-        table.add_row("/pulse", "Show system pulse timer status")
-        table.add_row("/pause", "Pause background processes")
-        table.add_row("/resume", "Resume background processes")
-
-        self.console.print(table)
+        # The help content is static, so the table is built once and reused
+        if self._help_table is None:
+            table = Table(title="Available Commands", show_header=True)
+            table.add_column("Command", style="cyan")
+            table.add_column("Description")
+
+            table.add_row("/help", "Show this help message")
+            table.add_row("/quit, /exit", "Exit the program")
+            table.add_row("/new", "Start a new session")
+            table.add_row("/end", "End the current session")
+            table.add_row("/stats", "Show system statistics")
+            table.add_row("/memories", "Show recent memories")
+            table.add_row("/search <query>", "Search memories")
+            table.add_row("/extract", "Force memory extraction")
+            table.add_row("/core", "Show core memories")
+            table.add_row("/addcore <category> <content>", "Add core memory (identity/relationship/preference/fact)")
+            table.add_row("/pulse", "Show system pulse timer status")
+            table.add_row("/pause", "Pause background processes")
+            table.add_row("/resume", "Resume background processes")
+            self._help_table = table
+
+        self.console.print(self._help_table)
 
     def _cmd_quit(self, args: str) -> None:
         """Quit the program."""
-        tracker = get_temporal_tracker()
+        tracker = self.tracker
 
         if tracker.is_session_active:
             self.console.print("[dim]Ending session...[/dim]")
@@ -635,18 +591,18 @@ class ChatCLI:
                 )
 
         self.console.print("[bold]Goodbye![/bold]")
-        self._running = False
+        self.stop()
 
     def _cmd_end_session(self, args: str) -> None:
         """End the current session."""
-        tracker = get_temporal_tracker()
+        tracker = self.tracker
 
         if not tracker.is_session_active:
             self.console.print("[yellow]No active session[/yellow]")
             return
 
         # Trigger memory extraction before ending
-        extractor = get_memory_extractor()
+        extractor = self.extractor
         extractor.extract_memories(force=True)
 
         summary = tracker.end_session()
@@ -659,7 +615,7 @@ class ChatCLI:
 
     def _cmd_new_session(self, args: str) -> None:
         """Start a new session."""
-        tracker = get_temporal_tracker()
+        tracker = self.tracker
 
         if tracker.is_session_active:
             self._cmd_end_session("")
@@ -670,18 +626,14 @@ class ChatCLI:
 
     def _cmd_stats(self, args: str) -> None:
         """Show statistics."""
-        from core.database import get_database
-
         db = get_database()
         stats = db.get_stats()
-        tracker = get_temporal_tracker()
+        tracker = self.tracker
         context = tracker.get_context()
-        extractor = get_memory_extractor()
+        extractor = self.extractor
         ext_stats = extractor.get_stats()
 
-        table = Table(title="System Statistics", show_header=True)
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value")
+        table = _new_table("System Statistics", _STATS_COLUMNS)
 
         table.add_row("Total Sessions", str(stats["total_sessions"]))
         table.add_row("Active Sessions", str(stats["active_sessions"]))
@@ -701,33 +653,27 @@ class ChatCLI:
 
     def _cmd_memories(self, args: str) -> None:
         """Show recent memories."""
-        vector_store = get_vector_store()
+        vector_store = self.vector_store
         count = vector_store.get_memory_count()
 
         if count == 0:
             self.console.print("[dim]No memories stored yet[/dim]")
             return
 
-        # Get recent memories by searching with empty-ish query
-        results = vector_store.search("recent events and information", limit=5)
+        memories = vector_store.get_recent_memories(limit=5)
 
-        if not results:
+        if not memories:
             self.console.print("[dim]No memories found[/dim]")
             return
 
-        table = Table(title=f"Recent Memories ({count} total)", show_header=True)
-        table.add_column("ID", style="dim")
-        table.add_column("Type", style="cyan")
-        table.add_column("Content")
-        table.add_column("Score", style="green")
+        table = _new_table(f"Recent Memories ({count} total)", _MEMORY_COLUMNS)
 
-        for result in results:
-            mem = result.memory
+        for mem in memories:
             table.add_row(
                 str(mem.id),
                 mem.memory_type or "?",
-                mem.content[:60] + "..." if len(mem.content) > 60 else mem.content,
-                f"{result.combined_score:.2f}"
+                _truncate(mem.content, 60),
+                f"{mem.importance:.2f}"
             )
 
         self.console.print(table)
@@ -738,7 +684,7 @@ class ChatCLI:
             self.console.print("[yellow]Usage: /search <query>[/yellow]")
             return
 
-        vector_store = get_vector_store()
+        vector_store = self.vector_store
 
         with self.console.status("[bold blue]Searching...[/bold blue]"):
             results = vector_store.search(args, limit=5)
@@ -747,19 +693,13 @@ class ChatCLI:
             self.console.print("[dim]No matching memories found[/dim]")
             return
 
-        table = Table(title=f"Search Results for: {args}", show_header=True)
-        table.add_column("Type", style="cyan")
-        table.add_column("Content")
-        table.add_column("Semantic", style="green")
-        table.add_column("Import", style="magenta")
-        table.add_column("Fresh", style="yellow")
-        table.add_column("Total", style="bold green")
+        table = _new_table(f"Search Results for: {args}", _SEARCH_COLUMNS)
 
         for result in results:
             mem = result.memory
             table.add_row(
                 mem.memory_type or "?",
-                mem.content[:50] + "..." if len(mem.content) > 50 else mem.content,
+                _truncate(mem.content, 50),
                 f"{result.semantic_score:.2f}",
                 f"{result.importance_score:.2f}",
                 f"{result.freshness_score:.2f}",
@@ -770,7 +710,7 @@ class ChatCLI:
 
     def _cmd_extract(self, args: str) -> None:
         """Force memory extraction."""
-        extractor = get_memory_extractor()
+        extractor = self.extractor
 
         with self.console.status("[bold blue]Extracting memories...[/bold blue]"):
             count = extractor.extract_memories(force=True)
@@ -782,19 +722,19 @@ class ChatCLI:
 
     def _cmd_pause(self, args: str) -> None:
         """Pause background processes."""
-        extractor = get_memory_extractor()
+        extractor = self.extractor
         extractor.stop()
         self.console.print("[yellow]Background processes paused[/yellow]")
 
     def _cmd_resume(self, args: str) -> None:
         """Resume background processes."""
-        extractor = get_memory_extractor()
+        extractor = self.extractor
         extractor.start()
         self.console.print("[green]Background processes resumed[/green]")
 
     def _cmd_core_memories(self, args: str) -> None:
         """Show core memories."""
-        core_source = get_core_memory_source()
+        core_source = self.core_source
         memories = core_source.get_all()
 
         if not memories:
@@ -811,7 +751,7 @@ class ChatCLI:
             table.add_row(
                 str(mem.id),
                 mem.category,
-                mem.content[:60] + "..." if len(mem.content) > 60 else mem.content
+                _truncate(mem.content, 60)
             )
 
         self.console.print(table)
@@ -836,7 +776,7 @@ class ChatCLI:
             self.console.print(f"[yellow]Invalid category. Use: {', '.join(valid_categories)}[/yellow]")
             return
 
-        core_source = get_core_memory_source()
+        core_source = self.core_source
         memory_id = core_source.add(content=content, category=category)
 
         if memory_id:
@@ -846,7 +786,7 @@ class ChatCLI:
 
     def _cmd_pulse(self, args: str) -> None:
         """Show system pulse timer status."""
-        if not config.SYSTEM_PULSE_ENABLED:
+        if not self._pulse_enabled:
             self.console.print("[dim]System pulse timer is disabled[/dim]")
             return
 
@@ -855,7 +795,6 @@ class ChatCLI:
             return
 
         stats = self._system_pulse_timer.get_stats()
-        from prompt_builder.sources.system_pulse import get_interval_label
 
         table = Table(title="Pulse Manager", show_header=False)
         table.add_column("Property", style="cyan")
@@ -882,26 +821,6 @@ class ChatCLI:
 
         self.console.print(table)
 
-    def _create_bar(self, value: float, min_val: float, max_val: float, width: int) -> str:
-        """Create a visual bar representation."""
-        normalized = (value - min_val) / (max_val - min_val)
-        filled = int(normalized * width)
-        empty = width - filled
-
-        if min_val < 0:  # Affinity-style bar (negative to positive)
-            mid = width // 2
-            if value >= 0:
-                left = "─" * mid
-                right_filled = int((value / max_val) * mid)
-                right = "█" * right_filled + "─" * (mid - right_filled)
-            else:
-                left_empty = int((abs(value) / abs(min_val)) * mid)
-                left = "─" * (mid - left_empty) + "▓" * left_empty
-                right = "─" * mid
-            return f"[dim]{left}[/dim]│[green]{right}[/green]"
-        else:  # Trust-style bar (0 to 1)
-            return f"[green]{'█' * filled}[/green][dim]{'─' * empty}[/dim]"
-
 
 # Global CLI instance
 _cli: Optional[ChatCLI] = None
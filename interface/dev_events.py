@@ -5,20 +5,31 @@ Callback-based event bus for dev/debug data. Dev tools in the web UI
 subscribe to events emitted here and display them in real time.
 """
 
+import json
 import threading
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable
-from dataclasses import dataclass, field, asdict
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, Callable, Sequence
+from dataclasses import dataclass, field, asdict, fields
 
 import config
 
+# Tool results are shown as a truncated preview on the dev page, so they are
+# cut down before serializing rather than dumped in full and discarded
+RESULT_PREVIEW_ITEMS = 50
+RESULT_PREVIEW_CHARS = 3000
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
+# One instance is allocated per event, so they use __slots__ (no per-instance
+# __dict__).
 
-@dataclass
+@dataclass(slots=True)
 class PromptAssemblyData:
     """Data about prompt assembly."""
     context_blocks: List[Dict[str, Any]] = field(default_factory=list)
@@ -26,7 +37,7 @@ class PromptAssemblyData:
     timestamp: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSearchCitationData:
     """Citation from a web search result."""
     title: str = ""
@@ -34,7 +45,7 @@ class WebSearchCitationData:
     cited_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandExecutionData:
     """Data about command execution."""
     command_name: str = ""
@@ -45,7 +56,7 @@ class CommandExecutionData:
     timestamp: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponsePassData:
     """Data about a single response pass."""
     pass_number: int = 0
@@ -54,13 +65,13 @@ class ResponsePassData:
     tokens_in: int = 0
     tokens_out: int = 0
     duration_ms: float = 0
-    commands_detected: List[str] = field(default_factory=list)
+    commands_detected: Sequence[str] = ()
     timestamp: str = ""
     web_searches_used: int = 0
     citations: List[WebSearchCitationData] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryRecallData:
     """Data about memory recall."""
     query: str = ""
@@ -68,24 +79,24 @@ class MemoryRecallData:
     timestamp: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveThoughtsData:
     """Data about active thoughts update."""
     thoughts: List[Dict[str, Any]] = field(default_factory=list)
     timestamp: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CuriosityData:
     """Data about curiosity engine state."""
     current_goal: Optional[Dict[str, Any]] = None
-    history: List[Dict[str, Any]] = field(default_factory=list)
-    cooldowns: List[Dict[str, Any]] = field(default_factory=list)
+    history: Sequence[Dict[str, Any]] = ()
+    cooldowns: Sequence[Dict[str, Any]] = ()
     timestamp: str = ""
     event: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentionData:
     """Data about intentions (reminders/goals)."""
     intentions: List[Dict[str, Any]] = field(default_factory=list)
@@ -144,28 +155,76 @@ def get_dev_event_bus() -> DevEventBus:
 # SERIALIZATION HELPER
 # =============================================================================
 
+def _preview_result(value: Any) -> Optional[str]:
+    """Render a tool result as a bounded, pretty-printed JSON preview."""
+    if value is None:
+        return None
+    truncated = False
+    if isinstance(value, str):
+        text = value
+    else:
+        # Trim large containers before dumping so cost doesn't scale with size
+        if isinstance(value, dict) and len(value) > RESULT_PREVIEW_ITEMS:
+            value = dict(islice(value.items(), RESULT_PREVIEW_ITEMS))
+            truncated = True
+        elif isinstance(value, (list, tuple)) and len(value) > RESULT_PREVIEW_ITEMS:
+            value = list(value[:RESULT_PREVIEW_ITEMS])
+            truncated = True
+        text = json.dumps(value, indent=2, default=str, ensure_ascii=False)
+    if len(text) > RESULT_PREVIEW_CHARS:
+        text = text[:RESULT_PREVIEW_CHARS]
+        truncated = True
+    return text + "\n... (truncated)" if truncated else text
+
+
 def _serialize(data) -> dict:
     """Convert a dev dataclass to a JSON-safe dict."""
-    d = asdict(data)
-    # result_data in CommandExecutionData can be arbitrary — stringify it
-    if "result_data" in d and d["result_data"] is not None:
-        try:
-            # If it's already JSON-serializable, leave it
-            import json
-            json.dumps(d["result_data"])
-        except (TypeError, ValueError):
-            d["result_data"] = str(d["result_data"])
-    return d
+    if isinstance(data, CommandExecutionData):
+        # Shallow copy: asdict would deep-copy result_data, which can be large
+        d = {f.name: getattr(data, f.name) for f in fields(data)}
+        d["result_data"] = _preview_result(data.result_data)
+        return d
+    return asdict(data)
 
 
 # =============================================================================
 # TIMESTAMP HELPER
 # =============================================================================
 
+class _BatchTimestamp(threading.local):
+    """Per-thread timestamp shared by emits inside dev_emit_batch()."""
+    value: Optional[str] = None
+
+
+_batch_timestamp = _BatchTimestamp()
+
+
 def _now() -> str:
+    cached = _batch_timestamp.value
+    if cached is not None:
+        return cached
     return datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
 
+@contextmanager
+def dev_emit_batch():
+    """
+    Stamp every emit in the block with one shared timestamp.
+
+    Used where several events describe the same moment (a response pass
+    and the commands it ran), so the time is formatted once. Nested
+    blocks reuse the outer timestamp.
+    """
+    if _batch_timestamp.value is not None:
+        yield
+        return
+    _batch_timestamp.value = _now()
+    try:
+        yield
+    finally:
+        _batch_timestamp.value = None
+
+
 # =============================================================================
 # EMIT FUNCTIONS
 # =============================================================================
@@ -211,7 +270,7 @@ def emit_response_pass(
     tokens_in: int = 0,
     tokens_out: int = 0,
     duration_ms: float = 0,
-    commands_detected: Optional[List[str]] = None,
+    commands_detected: Sequence[str] = (),
     web_searches_used: int = 0,
     citations: Optional[List[Any]] = None,
     **kwargs
@@ -222,11 +281,19 @@ def emit_response_pass(
     citation_data = []
     if citations:
         for c in citations:
-            citation_data.append(WebSearchCitationData(
-                title=getattr(c, "title", "") if hasattr(c, "title") else c.get("title", ""),
-                url=getattr(c, "url", "") if hasattr(c, "url") else c.get("url", ""),
-                cited_text=getattr(c, "cited_text", "") if hasattr(c, "cited_text") else c.get("cited_text", "")
-            ))
+            # Citations arrive as dicts or objects; check the kind once, not per field
+            if isinstance(c, dict):
+                citation_data.append(WebSearchCitationData(
+                    title=c.get("title", ""),
+                    url=c.get("url", ""),
+                    cited_text=c.get("cited_text", "")
+                ))
+            else:
+                citation_data.append(WebSearchCitationData(
+                    title=getattr(c, "title", ""),
+                    url=getattr(c, "url", ""),
+                    cited_text=getattr(c, "cited_text", "")
+                ))
     data = ResponsePassData(
         pass_number=pass_number,
         provider=provider,
@@ -234,7 +301,7 @@ def emit_response_pass(
         tokens_in=tokens_in,
         tokens_out=tokens_out,
         duration_ms=duration_ms,
-        commands_detected=commands_detected or [],
+        commands_detected=commands_detected,
         timestamp=_now(),
         web_searches_used=web_searches_used,
         citations=citation_data
@@ -258,8 +325,10 @@ def emit_active_thoughts_update(thoughts: List[Dict[str, Any]]):
     """Emit active thoughts update if dev mode is active."""
     if not config.DEV_MODE_ENABLED:
         return
+    # Sort by rank once here (the manager validates ranks as ints) so the
+    # dev page can render in list order without sorting on every update
     data = ActiveThoughtsData(
-        thoughts=thoughts,
+        thoughts=sorted(thoughts, key=itemgetter("rank")),
         timestamp=_now()
     )
     get_dev_event_bus().emit("active_thoughts", data)
@@ -267,8 +336,8 @@ def emit_active_thoughts_update(thoughts: List[Dict[str, Any]]):
 
 def emit_curiosity_update(
     current_goal: Optional[Dict[str, Any]],
-    history: Optional[List[Dict[str, Any]]] = None,
-    cooldowns: Optional[List[Dict[str, Any]]] = None,
+    history: Sequence[Dict[str, Any]] = (),
+    cooldowns: Sequence[Dict[str, Any]] = (),
     event: str = "updated"
 ):
     """Emit curiosity update if dev mode is active."""
@@ -276,8 +345,8 @@ def emit_curiosity_update(
         return
     data = CuriosityData(
         current_goal=current_goal,
-        history=history or [],
-        cooldowns=cooldowns or [],
+        history=history,
+        cooldowns=cooldowns,
         timestamp=_now(),
         event=event
     )
@@ -300,6 +369,10 @@ def emit_intentions_update(intentions: List[Dict[str, Any]], event: str = "updat
 # INITIAL LOAD FUNCTIONS
 # =============================================================================
 
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    return dt.isoformat() if dt else None
+
+
 def get_initial_active_thoughts_data() -> Optional[ActiveThoughtsData]:
     """Gather current active thoughts state. Returns None if unavailable."""
     if not config.DEV_MODE_ENABLED:
@@ -375,23 +448,20 @@ def get_initial_intentions_data() -> Optional[IntentionData]:
     try:
         from agency.intentions import get_intention_manager
         manager = get_intention_manager()
-        all_intentions = []
-        active = manager.get_all_active_intentions()
-        for intention in active:
-            all_intentions.append({
-                "id": intention.id,
-                "type": intention.type,
-                "content": intention.content,
-                "context": intention.context,
-                "trigger_type": intention.trigger_type,
-                "trigger_at": intention.trigger_at.isoformat() if intention.trigger_at else None,
-                "status": intention.status,
-                "priority": intention.priority,
-                "created_at": intention.created_at.isoformat() if intention.created_at else None,
-                "triggered_at": intention.triggered_at.isoformat() if intention.triggered_at else None,
-                "completed_at": intention.completed_at.isoformat() if intention.completed_at else None,
-                "outcome": intention.outcome,
-            })
+        all_intentions = [{
+            "id": i.id,
+            "type": i.type,
+            "content": i.content,
+            "context": i.context,
+            "trigger_type": i.trigger_type,
+            "trigger_at": _iso(i.trigger_at),
+            "status": i.status,
+            "priority": i.priority,
+            "created_at": _iso(i.created_at),
+            "triggered_at": _iso(i.triggered_at),
+            "completed_at": _iso(i.completed_at),
+            "outcome": i.outcome,
+        } for i in manager.get_all_active_intentions()]
         return IntentionData(
             intentions=all_intentions,
             timestamp="(initial load)",
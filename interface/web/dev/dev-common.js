@@ -90,7 +90,25 @@ const DevConnection = (() => {
 // Shared utilities
 // =========================================================================
 
+const _HTML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+};
+
 const DevUtils = {
+    /** Character limits for truncated fields, shared by all dev pages. */
+    LIMITS: {
+        query: 100,      // tool query echoes
+        summary: 120,    // one-line list entries
+        snippet: 150,    // context / citation excerpts
+        content: 300,    // memory content
+        block: 2000,     // prompt blocks and response text
+        result: 3000,    // tool results (matches RESULT_PREVIEW_CHARS server-side)
+    },
+
     /** Format a timestamp string for display. */
     formatTime(ts) {
         if (!ts || ts === '(initial load)') return ts || '';
@@ -104,6 +122,11 @@ const DevUtils = {
         return s.length > maxLen ? s.substring(0, maxLen) + '...' : s;
     },
 
+    /** Cut a multi-line block to maxLen characters, noting the cut on its own line. */
+    truncateBlock(text, maxLen) {
+        return text.length > maxLen ? `${text.substring(0, maxLen)}\n... (truncated)` : text;
+    },
+
     /** Create a badge element. */
     badge(text, className = 'badge-dim') {
         const el = document.createElement('span');
@@ -112,7 +135,10 @@ const DevUtils = {
         return el;
     },
 
-    /** Create a collapsible section. Returns {toggle, body} elements. */
+    /**
+     * Create a collapsible section. The body is only filled in the first
+     * time it is opened, since most sections are never expanded.
+     */
     collapsible(label, content) {
         const wrapper = document.createElement('div');
 
@@ -122,16 +148,20 @@ const DevUtils = {
 
         const body = document.createElement('div');
         body.className = 'collapsible-body';
-        if (typeof content === 'string') {
-            const pre = document.createElement('pre');
-            pre.className = 'content-block';
-            pre.textContent = content;
-            body.appendChild(pre);
-        } else if (content instanceof HTMLElement) {
-            body.appendChild(content);
-        }
+        let filled = false;
 
         toggle.addEventListener('click', () => {
+            if (!filled) {
+                filled = true;
+                if (typeof content === 'string') {
+                    const pre = document.createElement('pre');
+                    pre.className = 'content-block';
+                    pre.textContent = content;
+                    body.appendChild(pre);
+                } else if (content instanceof HTMLElement) {
+                    body.appendChild(content);
+                }
+            }
             const open = body.classList.toggle('open');
             toggle.textContent = `${open ? '▼' : '▶'} ${label}`;
         });
@@ -141,13 +171,64 @@ const DevUtils = {
         return wrapper;
     },
 
-    /** Scroll an element to the bottom if user hasn't scrolled up. */
-    autoScroll(el) {
-        if (!el) return;
-        const atBottom = el.scrollTop >= el.scrollHeight - el.clientHeight - 40;
-        if (atBottom) {
-            requestAnimationFrame(() => { el.scrollTop = el.scrollHeight; });
+    /**
+     * Wrap a batch renderer so bursts of events render once per frame.
+     * Returns a push(item) function; fn receives every item queued since
+     * the last frame. Only the newest maxItems are kept between frames.
+     */
+    frameBatch(fn, maxItems = Infinity) {
+        let pending = [];
+        let scheduled = false;
+
+        function flush() {
+            scheduled = false;
+            const items = pending;
+            pending = [];
+            fn(items);
         }
+
+        return (item) => {
+            pending.push(item);
+            if (pending.length > maxItems) pending.shift();
+            if (!scheduled) {
+                scheduled = true;
+                requestAnimationFrame(flush);
+            }
+        };
+    },
+
+    /**
+     * Wrap a full-view renderer so only the newest event is drawn, at most
+     * once per frame. Snapshots superseded within a frame, or while the
+     * tab is hidden, are never rendered.
+     */
+    latestPerFrame(fn) {
+        return DevUtils.frameBatch(items => fn(items[items.length - 1]), 1);
+    },
+
+    /** Remove the oldest children so at most maxItems remain (one DOM mutation). */
+    trimOldest(el, maxItems) {
+        if (!el) return;
+        const excess = el.childElementCount - maxItems;
+        if (excess <= 0) return;
+        const range = document.createRange();
+        range.setStartBefore(el.firstElementChild);
+        range.setEndAfter(el.children[excess - 1]);
+        range.deleteContents();
+    },
+
+    /**
+     * Whether the user is scrolled to (near) the bottom of an element.
+     * Check this before appending: measuring after an append forces a
+     * synchronous layout and misreads tall new content as "scrolled up".
+     */
+    isNearBottom(el) {
+        return !!el && el.scrollTop >= el.scrollHeight - el.clientHeight - 40;
+    },
+
+    /** Scroll an element to the bottom. */
+    scrollToBottom(el) {
+        if (el) el.scrollTop = el.scrollHeight;
     },
 
     /** Safely stringify a value for display. */
@@ -161,10 +242,8 @@ const DevUtils = {
         }
     },
 
-    /** Escape HTML entities. */
+    /** Escape HTML entities (single pass, safe inside attribute values too). */
     escapeHtml(str) {
-        const div = document.createElement('div');
-        div.textContent = str;
-        return div.innerHTML;
+        return String(str ?? '').replace(/[&<>"']/g, ch => _HTML_ESCAPES[ch]);
     }
 };
@@ -63,13 +63,14 @@ document.addEventListener('DOMContentLoaded', () => {
         themeToggle.textContent = theme === 'dark' ? '\u263E' : '\u2600';
     }
 
+    // Both highlight.js sheets are already loaded; a toggle only changes
+    // which one applies instead of fetching and parsing a new stylesheet.
+    const hljsDark = document.getElementById('hljs-theme-dark');
+    const hljsLight = document.getElementById('hljs-theme-light');
+
     function updateHljsTheme(theme) {
-        const link = document.getElementById('hljs-theme');
-        if (link) {
-            link.href = theme === 'dark'
-                ? 'https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css'
-                : 'https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css';
-        }
+        if (hljsDark) hljsDark.media = theme === 'dark' ? 'all' : 'not all';
+        if (hljsLight) hljsLight.media = theme === 'dark' ? 'not all' : 'all';
     }
 
     initTheme();
@@ -77,16 +78,38 @@ document.addEventListener('DOMContentLoaded', () => {
     // =====================================================================
     // Session timer
     // =====================================================================
+    // Text last written by each 1s timer; a tick that would write the same
+    // text (e.g. the interval drifting within one second) skips the DOM
+    let sessionTimerText = '';
+    let pulseCountdownText = '';
+
+    function setTimerText(el, text, last) {
+        if (text !== last) el.textContent = text;
+        return text;
+    }
+
+    // "h:mm:" / "m:" prefixes by whole minutes. The timers tick every second
+    // but a prefix only changes once a minute, so only seconds are padded.
+    const CLOCK_PREFIX_CACHE_SIZE = 256;
+    const clockPrefixes = new Map();
+
+    function formatClock(secs) {
+        if (secs <= 0) return '0:00';
+        const minutes = Math.floor(secs / 60);
+        let prefix = clockPrefixes.get(minutes);
+        if (prefix === undefined) {
+            prefix = minutes >= 60
+                ? `${Math.floor(minutes / 60)}:${String(minutes % 60).padStart(2, '0')}:`
+                : `${minutes}:`;
+            if (clockPrefixes.size >= CLOCK_PREFIX_CACHE_SIZE) clockPrefixes.clear();
+            clockPrefixes.set(minutes, prefix);
+        }
+        return prefix + String(secs % 60).padStart(2, '0');
+    }
+
     function updateSessionTimer() {
         const elapsed = Math.floor((Date.now() - sessionStart) / 1000);
-        const h = Math.floor(elapsed / 3600);
-        const m = Math.floor((elapsed % 3600) / 60);
-        const s = elapsed % 60;
-        if (h > 0) {
-            sessionTimer.textContent = `${h}:${String(m).padStart(2, '0')}:${String(s).padStart(2, '0')}`;
-        } else {
-            sessionTimer.textContent = `${m}:${String(s).padStart(2, '0')}`;
-        }
+        sessionTimerText = setTimerText(sessionTimer, formatClock(elapsed), sessionTimerText);
     }
 
     sessionTimerInterval = setInterval(updateSessionTimer, 1000);
@@ -97,7 +120,7 @@ document.addEventListener('DOMContentLoaded', () => {
     // =====================================================================
     function updatePulseCountdown() {
         if (!pulseState.reflective && !pulseState.action) {
-            pulseCountdown.textContent = '';
+            pulseCountdownText = setTimerText(pulseCountdown, '', pulseCountdownText);
             return;
         }
 
@@ -109,21 +132,9 @@ document.addEventListener('DOMContentLoaded', () => {
         const rRemaining = Math.max(0, pulseState.reflective - elapsed);
         const aRemaining = Math.max(0, pulseState.action - elapsed);
 
-        const fmtTime = (secs) => {
-            if (secs <= 0) return '0:00';
-            const m = Math.floor(secs / 60);
-            const s = secs % 60;
-            if (m >= 60) {
-                const h = Math.floor(m / 60);
-                const rm = m % 60;
-                return `${h}:${String(rm).padStart(2, '0')}:${String(s).padStart(2, '0')}`;
-            }
-            return `${m}:${String(s).padStart(2, '0')}`;
-        };
-
-        let text = `R: ${fmtTime(rRemaining)} | A: ${fmtTime(aRemaining)}`;
+        let text = `R: ${formatClock(rRemaining)} | A: ${formatClock(aRemaining)}`;
         if (pulseState.paused) text += ' (paused)';
-        pulseCountdown.textContent = text;
+        pulseCountdownText = setTimerText(pulseCountdown, text, pulseCountdownText);
     }
 
     pulseCountdownTimer = setInterval(updatePulseCountdown, 1000);
@@ -166,10 +177,18 @@ document.addEventListener('DOMContentLoaded', () => {
     // Input handling
     // =====================================================================
 
-    // Auto-resize textarea
-    chatInput.addEventListener('input', () => {
+    // Auto-resize textarea. Measuring forces a layout, so keystrokes are
+    // coalesced to one resize per frame.
+    let inputResizeFrame = 0;
+
+    function resizeInput() {
+        inputResizeFrame = 0;
         chatInput.style.height = 'auto';
         chatInput.style.height = Math.min(chatInput.scrollHeight, 150) + 'px';
+    }
+
+    chatInput.addEventListener('input', () => {
+        if (!inputResizeFrame) inputResizeFrame = requestAnimationFrame(resizeInput);
     });
 
     // Send on Enter (Shift+Enter for newline)
@@ -274,6 +293,18 @@ document.addEventListener('DOMContentLoaded', () => {
         Connection.send({ type: 'set_thinking', enabled: thinkingToggle.checked });
     });
 
+    // Option values of each pulse dropdown (fixed in index.html), so syncing
+    // to a server interval is a set lookup rather than a selector query
+    const pulseIntervalValues = new Map([
+        [reflectiveInterval, new Set(Array.from(reflectiveInterval.options, (o) => o.value))],
+        [actionInterval, new Set(Array.from(actionInterval.options, (o) => o.value))],
+    ]);
+
+    function syncIntervalSelect(select, seconds) {
+        const val = String(Math.round(seconds));
+        if (pulseIntervalValues.get(select).has(val)) select.value = val;
+    }
+
     reflectiveInterval.addEventListener('change', () => {
         Connection.send({
             type: 'set_pulse_interval',
@@ -341,14 +372,8 @@ document.addEventListener('DOMContentLoaded', () => {
 
         // Sync pulse intervals
         if (msg.pulse_intervals) {
-            const rVal = String(Math.round(msg.pulse_intervals.reflective));
-            const aVal = String(Math.round(msg.pulse_intervals.action));
-            if (reflectiveInterval.querySelector(`option[value="${rVal}"]`)) {
-                reflectiveInterval.value = rVal;
-            }
-            if (actionInterval.querySelector(`option[value="${aVal}"]`)) {
-                actionInterval.value = aVal;
-            }
+            syncIntervalSelect(reflectiveInterval, msg.pulse_intervals.reflective);
+            syncIntervalSelect(actionInterval, msg.pulse_intervals.action);
         }
 
         // Sync pulse countdown
@@ -403,21 +428,11 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     // Response complete - authoritative final text.
-    // For user messages this finalizes the streaming bubble.
-    // For pulse/reminder/telegram this adds a new message.
+    // Finalizes the streaming bubble for any source that streamed (user,
+    // pulse, reminder, telegram); streamComplete falls back to adding a
+    // new message when nothing was streamed (e.g. deferred retry).
     Connection.on('response_complete', (msg) => {
-        const source = msg.source || 'user';
-        const text = msg.text || '';
-
-        if (source === 'user') {
-            Chat.streamComplete(text);
-        } else if (source === 'pulse' || source === 'reminder') {
-            Chat.addMessage('assistant', text);
-        } else if (source === 'telegram') {
-            Chat.addMessage('assistant', text);
-        } else if (source === 'retry') {
-            Chat.addMessage('assistant', text);
-        }
+        Chat.streamComplete(msg.text || '');
     });
 
     Connection.on('processing_complete', () => {
@@ -468,15 +483,9 @@ document.addEventListener('DOMContentLoaded', () => {
     Connection.on('pulse_interval_changed', (msg) => {
         // Update the dropdown to reflect AI-initiated changes
         if (msg.pulse_type === 'reflective') {
-            const val = String(msg.interval_seconds);
-            if (reflectiveInterval.querySelector(`option[value="${val}"]`)) {
-                reflectiveInterval.value = val;
-            }
+            syncIntervalSelect(reflectiveInterval, msg.interval_seconds);
         } else if (msg.pulse_type === 'action') {
-            const val = String(msg.interval_seconds);
-            if (actionInterval.querySelector(`option[value="${val}"]`)) {
-                actionInterval.value = val;
-            }
+            syncIntervalSelect(actionInterval, msg.interval_seconds);
         }
     });
 
@@ -12,6 +12,9 @@ const Chat = (() => {
     let _streamingEl = null;       // The .message-body element being streamed into
     let _streamingText = '';        // Accumulated raw text for re-rendering
     let _renderTimer = null;       // Debounce timer for streaming re-renders
+    let _renderedText = null;      // Text currently rendered into _streamingEl
+    let _streamTail = null;        // Element holding the still-open tail of the stream
+    let _committedLength = 0;      // Length of _streamingText rendered as finished blocks
     let _autoScroll = true;        // Whether to auto-scroll on new content
 
     // Configure marked
@@ -43,11 +46,12 @@ const Chat = (() => {
         el.scrollTop = el.scrollHeight;
     }
 
-    /**
-     * Render markdown text to HTML.
-     */
-    function renderMarkdown(text) {
-        if (!text) return '';
+    // Rendered HTML for recent complete messages, oldest first. System and
+    // notification lines repeat often, so they are parsed only once.
+    const RENDER_CACHE_SIZE = 200;
+    const _renderCache = new Map();
+
+    function _parseMarkdown(text) {
         try {
             return marked.parse(text);
         } catch (e) {
@@ -56,56 +60,164 @@ const Chat = (() => {
         }
     }
 
+    // Code fence lines and blank-line block breaks, for finding where the
+    // streamed text can be split without cutting a block in half
+    const _BLOCK_MARKS = /^ {0,3}(?:```|~~~)|\n\n/gm;
+
+    /**
+     * Offset just past the last blank line after `from` that is outside a
+     * code fence. Text before it is made of finished blocks.
+     */
+    function _lastBlockBreak(text, from) {
+        let inFence = false;
+        let safe = from;
+        let m;
+        _BLOCK_MARKS.lastIndex = from;
+        while ((m = _BLOCK_MARKS.exec(text)) !== null) {
+            if (m[0] === '\n\n') {
+                if (!inFence) safe = m.index + 2;
+            } else {
+                inFence = !inFence;
+            }
+        }
+        return safe;
+    }
+
+    function _cacheRendered(text, html) {
+        if (_renderCache.size >= RENDER_CACHE_SIZE) {
+            _renderCache.delete(_renderCache.keys().next().value);
+        }
+        _renderCache.set(text, html);
+    }
+
+    /**
+     * Render markdown text to HTML.
+     */
+    function renderMarkdown(text) {
+        if (!text) return '';
+        let html = _renderCache.get(text);
+        if (html === undefined) {
+            html = _parseMarkdown(text);
+            _cacheRendered(text, html);
+        }
+        return html;
+    }
+
+    // Long messages are parsed in a worker so the page stays responsive;
+    // short ones are cheaper to parse here than to post across.
+    const WORKER_MIN_LENGTH = 2000;
+    const _workerJobs = new Map();   // job id -> {el, text, onDone}
+    let _workerSeq = 0;
+    let _worker = null;
+
+    function _finishJob(job, html) {
+        job.el.innerHTML = html;
+        if (job.onDone) job.onDone();
+    }
+
+    try {
+        _worker = new Worker('/static/js/markdown-worker.js');
+        _worker.onmessage = (e) => {
+            const job = _workerJobs.get(e.data.id);
+            if (!job) return;
+            _workerJobs.delete(e.data.id);
+            if (e.data.html === null) {
+                _finishJob(job, renderMarkdown(job.text));
+            } else {
+                _cacheRendered(job.text, e.data.html);
+                _finishJob(job, e.data.html);
+            }
+        };
+        _worker.onerror = () => {
+            // Worker failed (e.g. marked could not load): render here from now on
+            _worker = null;
+            _workerJobs.forEach(job => _finishJob(job, renderMarkdown(job.text)));
+            _workerJobs.clear();
+        };
+    } catch (e) {
+        _worker = null;
+    }
+
+    /**
+     * Render markdown into an element that is already in place, calling
+     * onDone once its content is set. Messages keep their position in the
+     * chat however long the worker takes.
+     */
+    function _renderInto(el, text, onDone) {
+        if (!_worker || !text || text.length < WORKER_MIN_LENGTH || _renderCache.has(text)) {
+            _finishJob({ el, onDone }, renderMarkdown(text));
+            return;
+        }
+        const id = ++_workerSeq;
+        _workerJobs.set(id, { el, text, onDone });
+        _worker.postMessage({ id, text });
+    }
+
+    const _HTML_ESCAPES = {
+        '&': '&amp;',
+        '<': '&lt;',
+        '>': '&gt;',
+        '"': '&quot;',
+        "'": '&#39;',
+    };
+
+    // One table-driven pass instead of a throwaway DOM node per call. Quotes
+    // are escaped too, since the result is also used in attribute values.
     function _escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        return String(text ?? '').replace(/[&<>"']/g, ch => _HTML_ESCAPES[ch]);
     }
 
+    // Built once; toLocaleTimeString with options sets up a formatter per call
+    const _timeFormat = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit' });
+
     /**
      * Format a timestamp for display.
      */
     function _formatTime(isoString) {
         if (!isoString) return '';
         try {
-            const d = new Date(isoString);
-            return d.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+            return _timeFormat.format(new Date(isoString));
         } catch (e) {
             return '';
         }
     }
 
+    const SENDER_NAMES = {
+        user: 'You',
+        assistant: 'Isaac',
+        system: 'System',
+        tool: 'Tool',
+        error: 'Error',
+    };
+
+    // Header/body structure built once and cloned for every message
+    let _messageSkeleton = null;
+
+    function _skeleton() {
+        if (!_messageSkeleton) {
+            _messageSkeleton = document.createElement('div');
+            _messageSkeleton.innerHTML =
+                '<div class="message-header">' +
+                '<span class="message-sender"></span>' +
+                '<span class="message-timestamp"></span>' +
+                '</div>' +
+                '<div class="message-body"></div>';
+        }
+        return _messageSkeleton;
+    }
+
     /**
      * Create a message DOM element.
      */
     function _createMessageEl(role, html, timestamp) {
-        const msg = document.createElement('div');
+        const msg = _skeleton().cloneNode(true);
         msg.className = `message ${role}`;
 
-        const header = document.createElement('div');
-        header.className = 'message-header';
-
-        const sender = document.createElement('span');
-        sender.className = 'message-sender';
-        if (role === 'user') sender.textContent = 'You';
-        else if (role === 'assistant') sender.textContent = 'Isaac';
-        else if (role === 'system') sender.textContent = 'System';
-        else if (role === 'tool') sender.textContent = 'Tool';
-        else if (role === 'error') sender.textContent = 'Error';
+        const header = msg.firstChild;
+        header.firstChild.textContent = SENDER_NAMES[role] || '';
+        header.lastChild.textContent = _formatTime(timestamp) || _formatTime(new Date().toISOString());
 
-        const ts = document.createElement('span');
-        ts.className = 'message-timestamp';
-        ts.textContent = _formatTime(timestamp) || _formatTime(new Date().toISOString());
-
-        header.appendChild(sender);
-        header.appendChild(ts);
-
-        const body = document.createElement('div');
-        body.className = 'message-body';
-        body.innerHTML = html;
-
-        msg.appendChild(header);
-        msg.appendChild(body);
+        msg.lastChild.innerHTML = html;
 
         return msg;
     }
@@ -113,12 +225,45 @@ const Chat = (() => {
     /**
      * Add a fully rendered message to the chat.
      */
-    function addMessage(role, text, timestamp, isHtml) {
+    // Messages added within one frame are inserted together, so a burst of
+    // system/tool lines costs one layout and scroll instead of one each.
+    const _pendingMessages = document.createDocumentFragment();
+    let _appendFrame = 0;
+
+    // Oldest bubbles beyond this are dropped so long sessions keep a bounded
+    // DOM. Only trimmed while following the bottom, never under a reader.
+    const MAX_MESSAGES = 500;
+
+    function _trimMessages() {
+        const container = _container();
+        let excess = container.childElementCount - MAX_MESSAGES;
+        while (excess-- > 0) container.firstElementChild.remove();
+    }
+
+    function _flushMessages() {
+        if (_appendFrame) {
+            cancelAnimationFrame(_appendFrame);
+            _appendFrame = 0;
+        }
+        if (!_pendingMessages.hasChildNodes()) return;
         const wasNearBottom = _isNearBottom();
-        const html = isHtml ? text : renderMarkdown(text);
-        const el = _createMessageEl(role, html, timestamp);
-        _container().appendChild(el);
-        if (wasNearBottom) scrollToBottom();
+        _container().appendChild(_pendingMessages);
+        if (wasNearBottom) {
+            _trimMessages();
+            scrollToBottom();
+        }
+    }
+
+    function addMessage(role, text, timestamp, isHtml) {
+        const el = _createMessageEl(role, isHtml ? text : '', timestamp);
+        _pendingMessages.appendChild(el);
+        if (!_appendFrame) _appendFrame = requestAnimationFrame(_flushMessages);
+        if (!isHtml) {
+            // Worker-rendered content can land after the flush; keep following
+            _renderInto(el.querySelector('.message-body'), text, () => {
+                if (el.isConnected && _autoScroll) scrollToBottom();
+            });
+        }
         return el;
     }
 
@@ -141,14 +286,41 @@ const Chat = (() => {
      * Begin streaming an assistant response.
      */
     function streamStart(timestamp) {
+        // Queued messages came first; put them in before the new bubble
+        _flushMessages();
         _autoScroll = _isNearBottom();
         _streamingText = '';
+        _renderedText = null;
 
         const el = _createMessageEl('assistant', '', timestamp);
         _container().appendChild(el);
         _streamingEl = el.querySelector('.message-body');
+        _streamTail = document.createElement('div');
+        _streamingEl.appendChild(_streamTail);
+        _committedLength = 0;
 
-        if (_autoScroll) scrollToBottom();
+        if (_autoScroll) {
+            _trimMessages();
+            scrollToBottom();
+        }
+    }
+
+    /**
+     * Render the streamed text so far. Finished blocks are parsed once and
+     * inserted ahead of the tail; only the open tail is re-parsed each time,
+     * so a long response costs linear rather than quadratic parsing.
+     * Partial text is never shown twice, so none of this uses the cache.
+     */
+    function _renderStream() {
+        const cut = _lastBlockBreak(_streamingText, _committedLength);
+        if (cut > _committedLength) {
+            _streamTail.insertAdjacentHTML(
+                'beforebegin', _parseMarkdown(_streamingText.slice(_committedLength, cut))
+            );
+            _committedLength = cut;
+        }
+        _streamTail.innerHTML = _parseMarkdown(_streamingText.slice(_committedLength));
+        _renderedText = _streamingText;
     }
 
     /**
@@ -163,9 +335,7 @@ const Chat = (() => {
         if (!_renderTimer) {
             _renderTimer = setTimeout(() => {
                 _renderTimer = null;
-                if (_streamingEl) {
-                    _streamingEl.innerHTML = renderMarkdown(_streamingText);
-                }
+                if (_streamingEl) _renderStream();
                 if (_autoScroll) scrollToBottom();
             }, 80);
         }
@@ -184,11 +354,22 @@ const Chat = (() => {
         const text = fullText || _streamingText;
 
         if (_streamingEl) {
-            _streamingEl.innerHTML = renderMarkdown(text);
-            // Apply syntax highlighting to code blocks
-            _streamingEl.querySelectorAll('pre code').forEach(block => {
-                hljs.highlightElement(block);
-            });
+            const el = _streamingEl;
+            const finish = () => {
+                // Apply syntax highlighting to code blocks
+                el.querySelectorAll('pre code').forEach(block => {
+                    hljs.highlightElement(block);
+                });
+                if (_autoScroll) scrollToBottom();
+            };
+            // Rendering block by block can differ from parsing the whole
+            // text (loose lists, reference links), so re-render unless the
+            // stream was shown in one piece and is already final
+            if (_committedLength > 0 || text !== _renderedText) {
+                _renderInto(el, text, finish);
+            } else {
+                finish();
+            }
         } else if (text) {
             // No streaming bubble was created (e.g., error before stream_start).
             // Fall back to adding as a regular message.
@@ -196,7 +377,9 @@ const Chat = (() => {
         }
 
         _streamingEl = null;
+        _streamTail = null;
         _streamingText = '';
+        _renderedText = null;
 
         if (_autoScroll) scrollToBottom();
     }
@@ -212,7 +395,7 @@ const Chat = (() => {
 
         let html = renderMarkdown(question);
         if (context) {
-            html += `<p style="color:var(--text-secondary);font-size:0.85em">${_escapeHtml(context)}</p>`;
+            html += `<p class="clarification-context">${_escapeHtml(context)}</p>`;
         }
         html += '<div class="clarification-options">';
         options.forEach((opt, i) => {
@@ -242,9 +425,16 @@ const Chat = (() => {
      * Clear all messages.
      */
     function clear() {
+        if (_appendFrame) {
+            cancelAnimationFrame(_appendFrame);
+            _appendFrame = 0;
+        }
+        _pendingMessages.replaceChildren();
         _container().innerHTML = '';
         _streamingEl = null;
+        _streamTail = null;
         _streamingText = '';
+        _renderedText = null;
     }
 
     // Track auto-scroll on user scroll
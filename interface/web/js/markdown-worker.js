@@ -0,0 +1,26 @@
+/**
+ * Pattern Project - Markdown Worker
+ *
+ * Parses long messages off the main thread for chat.js.
+ * Receives {id, text} and replies {id, html}; html is null on failure so
+ * the page can fall back to parsing the message itself.
+ */
+
+importScripts('https://cdnjs.cloudflare.com/ajax/libs/marked/12.0.1/marked.min.js');
+
+// Same parse options as chat.js; code highlighting is applied on the page
+marked.setOptions({
+    breaks: true,
+    gfm: true,
+});
+
+self.onmessage = (event) => {
+    const { id, text } = event.data;
+    let html = null;
+    try {
+        html = marked.parse(text);
+    } catch (e) {
+        // Leave html null; chat.js renders it on the main thread instead
+    }
+    self.postMessage({ id, html });
+};
@@ -13,13 +13,15 @@ const Process = (() => {
     // =====================================================================
     // Constants
     // =====================================================================
+    // Theme variables from style.css, so existing dots recolor in place when
+    // data-theme changes instead of keeping the dark palette
     const COLORS = {
-        active:     '#d4a574',  // amber  — something is happening
-        complete:   '#7a7770',  // muted  — finished
-        tool:       '#c4a7e7',  // purple — tool invocation
-        error:      '#e07a6b',  // red    — error
-        system:     '#5bb98c',  // green  — system events
-        delegation: '#6bb5e0',  // blue   — delegation events
+        active:     'var(--process-dot-active)',      // amber  — something is happening
+        complete:   'var(--process-dot-complete)',    // muted  — finished
+        tool:       'var(--process-dot-tool)',        // purple — tool invocation
+        error:      'var(--process-dot-error)',       // red    — error
+        system:     'var(--process-dot-system)',      // green  — system events
+        delegation: 'var(--process-dot-delegation)',  // blue   — delegation events
     };
 
     const DOT = '\u25CF';  // ●
@@ -48,9 +50,19 @@ const Process = (() => {
     // =====================================================================
     // Time formatting
     // =====================================================================
+    // One formatter for every node; the text is reused within the same second
+    const _timeFormat = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit', second: '2-digit' });
+    let _timeSecond = -1;
+    let _timeText = '';
+
     function _timeStr() {
-        const d = new Date();
-        return d.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit', second: '2-digit' });
+        const now = Date.now();
+        const second = Math.floor(now / 1000);
+        if (second !== _timeSecond) {
+            _timeSecond = second;
+            _timeText = _timeFormat.format(now);
+        }
+        return _timeText;
     }
 
     // =====================================================================
@@ -78,7 +90,7 @@ const Process = (() => {
 
     /**
      * Create a process node element.
-     *   dotColor: hex color for the status dot
+     *   dotColor: CSS color for the status dot (one of COLORS)
      *   label:    main label text
      *   detail:   optional secondary text
      *   isActive: if true, dot pulses amber
@@ -14,9 +14,10 @@ import secrets
 import threading
 import time
 import base64
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
@@ -30,6 +31,20 @@ from interface.process_panel import (
     ProcessEvent, ProcessEventType, get_process_event_bus
 )
 
+# Optional faster JSON encoder for broadcasts - stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data) -> str:
+    """Encode a WebSocket message as compact JSON text."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -39,6 +54,26 @@ DEV_DIR = WEB_DIR / "dev"
 AUTH_COOKIE_NAME = "pattern_session"
 AUTH_COOKIE_MAX_AGE = 7 * 24 * 3600  # 7 days
 
+# Recent log-style dev events kept for dev pages opened after they fired.
+# The prompt and memory pages only ever show the latest event. Thoughts,
+# curiosity and intentions are snapshots gathered fresh on connect instead.
+DEV_REPLAY_SIZES = {
+    "prompt_assembly": 1,
+    "memory_recall": 1,
+    "command_executed": 50,
+    "response_pass": 50,
+}
+
+# Dev events that carry a full snapshot; when several are queued at once only
+# the newest is sent. command_executed / response_pass are logs and are not
+# coalesced.
+DEV_LATEST_ONLY = frozenset({
+    "prompt_assembly", "memory_recall", "active_thoughts", "curiosity", "intentions",
+})
+
+# Streamed tokens are held this long (seconds) and sent as one stream_chunk
+STREAM_CHUNK_INTERVAL = 0.033
+
 
 # ---------------------------------------------------------------------------
 # Authentication helpers
@@ -126,15 +161,37 @@ class AuthMiddleware(BaseHTTPMiddleware):
 # WebSocket connection manager
 # ---------------------------------------------------------------------------
 class ConnectionManager:
-    """Manages active WebSocket connections and broadcasts engine events."""
+    """Manages active WebSocket connections and broadcasts engine events.
+
+    Broadcasts from other threads are queued in an outbox and drained by a
+    single task on the event loop, so a burst of events costs one loop
+    wakeup rather than one scheduled coroutine per message. Messages are
+    JSON-encoded by the sending thread, keeping that work off the loop. With
+    ``max_pending`` set, the oldest queued messages are dropped once the
+    outbox is full (for streams where only recent data matters). Keyed
+    messages hold a single slot per key and only their newest payload is
+    kept, so superseded snapshots are released straight away. Streamed
+    response text is held briefly and sent as one chunk per interval.
+    """
 
-    def __init__(self):
+    def __init__(self, max_pending: Optional[int] = None):
         self._connections: Set[WebSocket] = set()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._outbox: deque = deque(maxlen=max_pending)  # (key, text or None)
+        self._latest: Dict[str, str] = {}  # key -> newest queued text
+        self._outbox_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._stream_chunks: List[str] = []  # held stream text, under _outbox_lock
+        self._stream_flush_scheduled = False
 
     def set_loop(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
 
+    @property
+    def has_connections(self) -> bool:
+        """Whether any client is currently connected."""
+        return bool(self._connections)
+
     async def accept(self, ws: WebSocket):
         await ws.accept()
         self._connections.add(ws)
@@ -144,9 +201,9 @@ class ConnectionManager:
         self._connections.discard(ws)
         log_info(f"WebSocket disconnected ({len(self._connections)} total)", prefix="🌐")
 
-    async def _send_json(self, ws: WebSocket, data: dict):
+    async def _send_text(self, ws: WebSocket, text: str):
         try:
-            await ws.send_json(data)
+            await ws.send_text(text)
         except Exception as exc:
             self._connections.discard(ws)
             log_info(f"WebSocket send failed, client removed: {exc.__class__.__name__}", prefix="🌐")
@@ -155,14 +212,100 @@ class ConnectionManager:
         """Send a message to all connected clients."""
         if not self._connections:
             return
-        tasks = [self._send_json(ws, data) for ws in list(self._connections)]
+        # Encode once for every client rather than once per send_json
+        await self._broadcast_text(_dumps(data))
+
+    async def _broadcast_text(self, text: str):
+        """Send already-encoded JSON text to all connected clients."""
+        tasks = [self._send_text(ws, text) for ws in list(self._connections)]
         await asyncio.gather(*tasks, return_exceptions=True)
 
-    def broadcast_sync(self, data: dict):
-        """Thread-safe broadcast from synchronous code (engine callbacks)."""
+    def broadcast_sync(self, data: dict, key: Optional[str] = None):
+        """Thread-safe broadcast from synchronous code (engine callbacks).
+
+        Messages sharing a ``key`` supersede each other: a key takes one
+        place in the outbox and only its newest payload is sent.
+        """
         if self._loop is None or not self._connections:
             return
-        asyncio.run_coroutine_threadsafe(self.broadcast(data), self._loop)
+        # Encode here on the calling thread so the event loop only sends
+        text = _dumps(data)
+        with self._outbox_lock:
+            # Stream text held so far was produced first, so it goes out first
+            self._queue_stream_chunks()
+            if key is None:
+                self._outbox.append((None, text))
+            else:
+                if key not in self._latest:
+                    self._outbox.append((key, None))
+                self._latest[key] = text
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain_outbox(), self._loop)
+        except RuntimeError:
+            # Loop already closed (shutdown); let a later call retry
+            with self._outbox_lock:
+                self._drain_scheduled = False
+
+    def stream_chunk_sync(self, text: str):
+        """Thread-safe send of streamed response text.
+
+        Chunks arriving within STREAM_CHUNK_INTERVAL are joined into one
+        stream_chunk message, so fast token streams cost one send per
+        interval rather than one per token.
+        """
+        if self._loop is None or not self._connections or not text:
+            return
+        with self._outbox_lock:
+            self._stream_chunks.append(text)
+            if self._stream_flush_scheduled:
+                return
+            self._stream_flush_scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(
+                self._loop.call_later, STREAM_CHUNK_INTERVAL, self._flush_stream_chunks
+            )
+        except RuntimeError:
+            # Loop already closed (shutdown)
+            with self._outbox_lock:
+                self._stream_flush_scheduled = False
+
+    def _queue_stream_chunks(self):
+        """Move held stream text into the outbox. Caller holds _outbox_lock."""
+        if self._stream_chunks:
+            text = "".join(self._stream_chunks)
+            self._stream_chunks.clear()
+            self._outbox.append((None, _dumps({"type": "stream_chunk", "text": text})))
+
+    def _flush_stream_chunks(self):
+        """Timer callback on the event loop: send the held stream text."""
+        with self._outbox_lock:
+            self._stream_flush_scheduled = False
+            self._queue_stream_chunks()
+            if self._drain_scheduled or not self._outbox:
+                return
+            self._drain_scheduled = True
+        asyncio.ensure_future(self._drain_outbox())
+
+    async def _drain_outbox(self):
+        """Send queued messages in order until the outbox is empty."""
+        while True:
+            with self._outbox_lock:
+                if not self._outbox and not self._latest:
+                    self._drain_scheduled = False
+                    return
+                pending = list(self._outbox)
+                self._outbox.clear()
+                latest, self._latest = self._latest, {}
+            for key, text in pending:
+                if key is not None:
+                    text = latest.pop(key)
+                await self._broadcast_text(text)
+            # Keys whose outbox slot was pushed out by max_pending
+            for text in latest.values():
+                await self._broadcast_text(text)
 
 
 # ---------------------------------------------------------------------------
@@ -284,6 +427,14 @@ _FORWARDED_PROCESS_EVENTS = frozenset({
     ProcessEventType.TOOL_INVOKED,
 })
 
+# Engine events that feed the dev tools; everything else (stream chunks in
+# particular) skips the dev forwarder entirely
+_DEV_ENGINE_EVENTS = frozenset({
+    EngineEventType.PROMPT_ASSEMBLED,
+    EngineEventType.DEV_RESPONSE_PASS,
+    EngineEventType.DEV_COMMAND_EXECUTED,
+})
+
 
 def _process_event_to_ws(event: ProcessEvent) -> Optional[dict]:
     """Convert a ProcessEvent into a JSON-serialisable dict for WebSocket."""
@@ -344,7 +495,9 @@ class WebServer:
         self._processing_lock = threading.Lock()
 
         self.manager = ConnectionManager()
-        self.dev_manager = ConnectionManager()  # Separate WS pool for /ws/dev
+        # Separate WS pool for /ws/dev; dev events may be dropped under a burst
+        self.dev_manager = ConnectionManager(max_pending=256)
+        self._dev_backlog: Dict[str, deque] = {}  # event type -> raw dev dataclasses
         self.app = self._create_app()
 
     # -----------------------------------------------------------------------
@@ -417,6 +570,9 @@ class WebServer:
             "prompt_assembly", "command_executed", "response_pass",
             "memory_recall", "active_thoughts", "curiosity", "intentions",
         ]
+        self._dev_backlog = {
+            etype: deque(maxlen=size) for etype, size in DEV_REPLAY_SIZES.items()
+        }
         for etype in event_types:
             bus.add_callback(etype, self._make_dev_forwarder(etype))
 
@@ -424,15 +580,29 @@ class WebServer:
         """Return a callback that serializes a dev dataclass and broadcasts."""
         from interface.dev_events import _serialize
 
+        backlog = self._dev_backlog.get(event_type)
+        key = event_type if event_type in DEV_LATEST_ONLY else None
+
         def _forward(data):
+            # Keep the raw dataclass; it is only serialized if replayed
+            if backlog is not None:
+                backlog.append(data)
+            # No dev page open: skip serializing a message nobody receives
+            if not self.dev_manager.has_connections:
+                return
             msg = _serialize(data)
             msg["type"] = f"dev_{event_type}"
-            self.dev_manager.broadcast_sync(msg)
+            self.dev_manager.broadcast_sync(msg, key=key)
 
         return _forward
 
     async def _send_initial_dev_state(self, ws: WebSocket):
-        """Send current thoughts/curiosity/intentions state to a newly-connected dev client."""
+        """Send current state and recent dev events to a newly-connected dev client.
+
+        Thoughts, curiosity and intentions are gathered fresh; the log-style
+        events are replayed from the backlog so a page opened mid-session
+        isn't empty until the next event fires.
+        """
         from interface.dev_events import (
             get_initial_active_thoughts_data,
             get_initial_curiosity_data,
@@ -440,17 +610,30 @@ class WebServer:
             _serialize,
         )
 
-        for event_type, getter in [
+        initial = [
             ("active_thoughts", get_initial_active_thoughts_data),
             ("curiosity", get_initial_curiosity_data),
             ("intentions", get_initial_intentions_data),
-        ]:
-            data = getter()
+        ]
+        # The getters do blocking database reads; run them together in the
+        # default executor instead of one after another on the event loop
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, getter) for _, getter in initial)
+        )
+
+        for (event_type, _), data in zip(initial, results):
             if data is not None:
                 msg = _serialize(data)
                 msg["type"] = f"dev_{event_type}"
                 await ws.send_json(msg)
 
+        for event_type, backlog in self._dev_backlog.items():
+            for data in list(backlog):
+                msg = _serialize(data)
+                msg["type"] = f"dev_{event_type}"
+                await ws.send_json(msg)
+
     def _forward_dev_engine_event(self, event: EngineEvent):
         """Forward dev-relevant engine events to the DevEventBus emit functions."""
         from interface.dev_events import emit_prompt_assembly, emit_response_pass, emit_command_executed
@@ -485,12 +668,16 @@ class WebServer:
     # -----------------------------------------------------------------------
     def _on_engine_event(self, event: EngineEvent):
         """Bridge engine events to WebSocket broadcasts."""
-        msg = _engine_event_to_ws(event)
-        if msg:
-            self.broadcast_sync(msg)
+        # Straight to the manager: every engine event passes through here
+        if event.event_type == EngineEventType.STREAM_CHUNK:
+            self.manager.stream_chunk_sync(event.data.get("text", ""))
+        else:
+            msg = _engine_event_to_ws(event)
+            if msg:
+                self.manager.broadcast_sync(msg)
 
         # Forward dev-relevant engine events to DevEventBus
-        if config.DEV_MODE_ENABLED:
+        if event.event_type in _DEV_ENGINE_EVENTS and config.DEV_MODE_ENABLED:
             self._forward_dev_engine_event(event)
 
         # Track processing state
@@ -764,8 +951,8 @@ class WebServer:
             except ImportError:
                 return  # Voice module not available, stop polling
             try:
-                while not voice_event_queue.empty():
-                    event = voice_event_queue.get_nowait()
+                while voice_event_queue:
+                    event = voice_event_queue.popleft()
                     user_text = event.get("user_text", "")
                     isaac_text = event.get("isaac_text", "")
                     ts = event.get("timestamp")
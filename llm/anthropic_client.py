@@ -59,7 +59,7 @@ class AnthropicResponse:
 @dataclass
 class StreamingState:
     """Tracks state during streaming response."""
-    text: str = ""
+    _text: str = ""  # Text from completed blocks; see the text property
     input_tokens: int = 0
     output_tokens: int = 0
     tool_calls: List[ToolCall] = field(default_factory=list)
@@ -75,17 +75,33 @@ class StreamingState:
     # Server-side tool details (web_search, web_fetch)
     server_tool_details: List[Dict[str, Any]] = field(default_factory=list)
     # Extended thinking
-    thinking_text: str = ""  # Accumulated thinking content
-    _current_thinking_text: str = ""  # Thinking text for current block
+    _thinking_text: str = ""  # Thinking from completed blocks
+    _current_thinking_parts: List[str] = field(default_factory=list)  # Thinking chunks for current block
     _current_thinking_signature: str = ""  # Signature for current thinking block
-    # Per-block text tracking (avoids cumulative text in raw_content)
-    _current_block_text: str = ""
+    # Per-block text tracking (avoids cumulative text in raw_content).
+    # Chunks are joined once at content_block_stop rather than concatenated
+    # on every delta, which would copy the whole string each time.
+    _current_block_parts: List[str] = field(default_factory=list)
     # Error classification (set when stop_reason == "error")
     _error_type: Optional[str] = None  # "overloaded", "rate_limited", "server_error", etc.
     # Prompt caching
     cache_creation_input_tokens: int = 0
     cache_read_input_tokens: int = 0
 
+    @property
+    def text(self) -> str:
+        """Accumulated response text, including the block still streaming."""
+        if self._current_block_parts:
+            return self._text + "".join(self._current_block_parts)
+        return self._text
+
+    @property
+    def thinking_text(self) -> str:
+        """Accumulated thinking content, including the block still streaming."""
+        if self._current_thinking_parts:
+            return self._thinking_text + "".join(self._current_thinking_parts)
+        return self._thinking_text
+
     def to_response(self) -> AnthropicResponse:
         """Convert streaming state to final AnthropicResponse."""
         return AnthropicResponse(
@@ -838,11 +854,11 @@ class AnthropicClient:
 
                             if block_type == "text":
                                 # Starting a new text block - reset per-block text
-                                state._current_block_text = ""
+                                state._current_block_parts = []
 
                             elif block_type == "thinking":
                                 # Starting a thinking block - reset current thinking state
-                                state._current_thinking_text = ""
+                                state._current_thinking_parts = []
                                 state._current_thinking_signature = ""
                                 log_info("Thinking block started", prefix="🧠")
 
@@ -885,8 +901,7 @@ class AnthropicClient:
                                 # Thinking content chunk
                                 thinking_chunk = getattr(delta, "thinking", "")
                                 if thinking_chunk:
-                                    state._current_thinking_text += thinking_chunk
-                                    state.thinking_text += thinking_chunk
+                                    state._current_thinking_parts.append(thinking_chunk)
 
                             elif delta_type == "signature_delta":
                                 # Thinking block signature (required for continuations)
@@ -898,8 +913,7 @@ class AnthropicClient:
                                 # Text chunk arrived
                                 text_chunk = getattr(delta, "text", "")
                                 if text_chunk:
-                                    state.text += text_chunk
-                                    state._current_block_text += text_chunk
+                                    state._current_block_parts.append(text_chunk)
                                     text_chunks_yielded += 1
                                     yield (text_chunk, state)
 
@@ -913,13 +927,15 @@ class AnthropicClient:
                         # Content block finished
                         if current_block_type == "thinking":
                             # Finalize thinking block - add to raw_content for continuations
-                            log_info(f"Thinking block complete: {len(state._current_thinking_text)} chars", prefix="🧠")
+                            thinking_block = "".join(state._current_thinking_parts)
+                            state._thinking_text += thinking_block
+                            log_info(f"Thinking block complete: {len(thinking_block)} chars", prefix="🧠")
                             state.raw_content.append({
                                 "type": "thinking",
-                                "thinking": state._current_thinking_text,
+                                "thinking": thinking_block,
                                 "signature": state._current_thinking_signature
                             })
-                            state._current_thinking_text = ""
+                            state._current_thinking_parts = []
                             state._current_thinking_signature = ""
 
                         elif current_block_type == "redacted_thinking":
@@ -1012,10 +1028,13 @@ class AnthropicClient:
                             # Add text block to raw_content using per-block
                             # text (NOT cumulative state.text, which would
                             # duplicate earlier text blocks' content).
+                            block_text = "".join(state._current_block_parts)
+                            state._text += block_text
                             state.raw_content.append({
                                 "type": "text",
-                                "text": state._current_block_text
+                                "text": block_text
                             })
+                            state._current_block_parts = []
 
                         current_block_type = None
 
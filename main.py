@@ -42,7 +42,6 @@ from llm.router import init_llm_router, get_llm_router, LLMProvider
 from memory.conversation import init_conversation_manager, get_conversation_manager
 from memory.vector_store import init_vector_store
 from memory.extractor import init_memory_extractor
-from interface.cli import init_cli, get_cli
 # Visual capture is now stateless - no init/start/stop lifecycle needed.
 # Capture happens on-demand via capture_all_visuals() in the engine.
 # Import availability checker for startup logging only.
@@ -202,9 +201,6 @@ def initialize_system() -> bool:
     # Initialize subprocess manager
     init_subprocess_manager()
 
-    # Initialize CLI
-    init_cli()
-
     return True
 
 
@@ -411,6 +407,13 @@ def stop_background_services() -> None:
         except Exception as e:
             log_error(f"Error stopping Guardian checker: {e}")
 
+    # Write any settings change still waiting on its save delay
+    try:
+        from core.user_settings import get_user_settings
+        get_user_settings().flush()
+    except Exception as e:
+        log_error(f"Error saving user settings: {e}")
+
     # Log final lock stats
     try:
         lock_mgr = get_lock_manager()
@@ -579,8 +582,10 @@ def run_cli_mode() -> int:
         # Print ready message
         log_ready()
 
-        # Start CLI (blocks until exit)
-        cli = get_cli()
+        # Start CLI (blocks until exit). Imported here so web mode never
+        # loads rich or the console interface.
+        from interface.cli import init_cli
+        cli = init_cli()
         cli.set_engine(engine)
         cli.start()
 
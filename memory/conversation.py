@@ -38,6 +38,13 @@ class ConversationManager:
     def __init__(self):
         self._lock_manager = get_lock_manager()
 
+        # Unprocessed turns backing get_api_messages(), kept in sync by
+        # add_turn() and mark_processed() so each API call skips the DB.
+        # None means "not loaded"; _window_truncated records whether the
+        # safety cap left older unprocessed turns out of the cache.
+        self._window_cache: Optional[List[ConversationTurn]] = None
+        self._window_truncated = False
+
         # Prefixes that AI may echo from prompt metadata but shouldn't persist
         # These become stale and conflict with real semantic timestamps
         self._temporal_prefixes_to_strip = [
@@ -130,13 +137,15 @@ class ConversationManager:
                 (session_id, role, content, input_type, time_since_last)
             )
 
-            # Get the new ID
+            # Read back the new row
             result = db.execute(
-                "SELECT id FROM conversations ORDER BY id DESC LIMIT 1",
+                "SELECT * FROM conversations ORDER BY id DESC LIMIT 1",
                 fetch=True
             )
 
             turn_id = result[0]["id"]
+            if self._window_cache is not None:
+                self._append_to_window_cache(self._row_to_turn(result[0]))
 
         # Check if memory extraction threshold reached (outside the lock)
         # Import here to avoid circular imports
@@ -279,27 +288,22 @@ class ConversationManager:
         """
         from core.temporal import format_fuzzy_relative_time
         from core.logger import log_info
-        from config import CONTEXT_WINDOW_SIZE, CONTEXT_OVERFLOW_TRIGGER, CONTEXT_EXTRACTION_BATCH
 
         # DIAGNOSTIC: Log entry
         log_info("=== get_api_messages START ===", prefix="📜")
 
-        # Determine the limit to use
+        # Determine the turns to use
         if limit is None:
             # Load ALL unprocessed turns - let the context window grow naturally
             # from CONTEXT_WINDOW_SIZE (30) toward CONTEXT_OVERFLOW_TRIGGER (40).
             # Extraction fires at the trigger and snaps back to window size.
             # Safety cap prevents pathological growth if extraction stalls.
-            actual_count = self.get_unprocessed_count()
-            safety_cap = CONTEXT_OVERFLOW_TRIGGER + CONTEXT_EXTRACTION_BATCH
-            limit = min(actual_count, safety_cap)
-            log_info(f"Unprocessed turns: {actual_count}, safety cap: {safety_cap}, limit: {limit}", prefix="📜")
+            # Served from the incrementally maintained window cache.
+            turns = self._get_window_turns()
         else:
             log_info(f"Using provided limit: {limit}", prefix="📜")
-
-        # Use get_context_window for cross-session, excludes-processed behavior
-        log_info(f"Fetching context window (limit={limit})...", prefix="📜")
-        turns = self.get_context_window(limit=limit)
+            log_info(f"Fetching context window (limit={limit})...", prefix="📜")
+            turns = self.get_context_window(limit=limit)
         log_info(f"Got {len(turns)} raw turns from context window", prefix="📜")
 
         # Format and filter
@@ -333,14 +337,49 @@ class ConversationManager:
 
         log_info(f"Formatted {len(result)} messages for API (after filtering)", prefix="📜")
 
-        # Log role distribution
-        user_count = sum(1 for m in result if m["role"] == "user")
-        assistant_count = sum(1 for m in result if m["role"] == "assistant")
+        # Log role distribution. Messages now alternate starting with user,
+        # so the split follows from the length without another pass.
+        assistant_count = len(result) // 2
+        user_count = len(result) - assistant_count
         log_info(f"Role distribution: {user_count} user, {assistant_count} assistant", prefix="📜")
 
         log_info("=== get_api_messages END ===", prefix="📜")
         return result
 
+    def _get_window_turns(self) -> List[ConversationTurn]:
+        """
+        Get all unprocessed turns (up to the safety cap), loading the window
+        cache from the database only when it is not already populated.
+
+        Returns:
+            A copy of the cached turns in chronological order (oldest first)
+        """
+        from core.logger import log_info
+        from config import CONTEXT_OVERFLOW_TRIGGER, CONTEXT_EXTRACTION_BATCH
+
+        with self._lock_manager.acquire("conversation"):
+            if self._window_cache is None:
+                actual_count = self.get_unprocessed_count()
+                safety_cap = CONTEXT_OVERFLOW_TRIGGER + CONTEXT_EXTRACTION_BATCH
+                limit = min(actual_count, safety_cap)
+                log_info(f"Unprocessed turns: {actual_count}, safety cap: {safety_cap}, limit: {limit}", prefix="📜")
+                log_info(f"Fetching context window (limit={limit})...", prefix="📜")
+                self._window_cache = self.get_context_window(limit=limit)
+                self._window_truncated = actual_count > safety_cap
+            else:
+                log_info(f"Using cached context window ({len(self._window_cache)} turns)", prefix="📜")
+            return list(self._window_cache)
+
+    def _append_to_window_cache(self, turn: ConversationTurn) -> None:
+        """Append a newly stored turn to the window cache, honoring the safety cap."""
+        from config import CONTEXT_OVERFLOW_TRIGGER, CONTEXT_EXTRACTION_BATCH
+
+        self._window_cache.append(turn)
+        overflow = len(self._window_cache) - (CONTEXT_OVERFLOW_TRIGGER + CONTEXT_EXTRACTION_BATCH)
+        if overflow > 0:
+            del self._window_cache[:overflow]
+            self._window_truncated = True
+
     @db_retry()
     def get_context_window(
         self,
@@ -438,6 +477,17 @@ class ConversationManager:
                 (now, *turn_ids)
             )
 
+            if self._window_cache is not None:
+                if self._window_truncated:
+                    # Older unprocessed turns may now fall inside the window
+                    self._window_cache = None
+                    self._window_truncated = False
+                else:
+                    processed = set(turn_ids)
+                    self._window_cache = [
+                        t for t in self._window_cache if t.id not in processed
+                    ]
+
     @db_retry()
     def get_unprocessed_count(self) -> int:
         """Get count of unprocessed turns."""
@@ -523,6 +573,9 @@ class ConversationManager:
                 """
             )
 
+            self._window_cache = None
+            self._window_truncated = False
+
             log_warning(f"Cleaned up {count} empty assistant message(s)", prefix="🧹")
             return count
 
@@ -488,6 +488,23 @@ class VectorStore:
         )
         return result[0]["count"] if result else 0
 
+    @db_retry()
+    def get_recent_memories(self, limit: int = 5) -> List[Memory]:
+        """Get the most recently stored memories, newest first.
+
+        A plain recency query - no embedding or scoring, and access stats
+        are not touched.
+        """
+        with self._lock_manager.acquire("memory"):
+            db = get_database()
+            result = db.execute(
+                "SELECT * FROM memories ORDER BY created_at DESC, id DESC LIMIT ?",
+                (limit,),
+                fetch=True
+            )
+
+            return [self._row_to_memory(row) for row in result]
+
     @db_retry()
     def get_memories_by_session(self, session_id: int) -> List[Memory]:
         """Get all memories from a specific session."""
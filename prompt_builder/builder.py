@@ -12,7 +12,10 @@ from core.logger import log_info, log_error, log_section
 
 @dataclass
 class AssembledPrompt:
-    """The final assembled prompt with metadata."""
+    """The final assembled prompt with metadata.
+
+    context_blocks is ordered by priority (PromptBuilder.build sorts it once).
+    """
     system_prompt: str
     user_message: str
     context_blocks: List[ContextBlock]
@@ -25,13 +28,13 @@ class AssembledPrompt:
 
         parts = [self.system_prompt] if self.system_prompt else []
 
-        # Add context blocks sorted by priority, inserting cache breakpoints
-        # between stable, semi-stable, and dynamic content when prompt caching
-        # is enabled.  Two breakpoints → up to 3 segments cached independently.
-        sorted_blocks = sorted(self.context_blocks, key=lambda b: b.priority)
+        # Add context blocks (already in priority order), inserting cache
+        # breakpoints between stable, semi-stable, and dynamic content when
+        # prompt caching is enabled.  Two breakpoints → up to 3 segments
+        # cached independently.
         stable_bp_inserted = False
         semistable_bp_inserted = False
-        for block in sorted_blocks:
+        for block in self.context_blocks:
             if block.content:
                 if config.PROMPT_CACHE_ENABLED:
                     if (not stable_bp_inserted
@@ -140,6 +143,10 @@ class PromptBuilder:
                 log_error(f"Error getting context from {source.source_name}: {e}")
                 # Continue with other sources
 
+        # Sources are already priority-ordered, but a block may carry its own
+        # priority; the stable sort is effectively a single linear pass here.
+        blocks.sort(key=lambda b: b.priority)
+
         return AssembledPrompt(
             system_prompt=system_prompt,
             user_message=user_input,
@@ -245,17 +245,19 @@ class SemanticMemorySource(ContextSource):
             warmth_stats = self._warmth_cache.get_stats()
             recall_data = []
             for r in all_results:
-                entry = self._warmth_cache.get_entry(r.memory.id)
-                warmth = self._warmth_cache.get_warmth(r.memory.id)
+                memory = r.memory
+                # One cache lookup per memory; get_warmth() would repeat it
+                entry = self._warmth_cache.get_entry(memory.id)
+                warmth = entry.combined if entry else 0.0
                 recall_data.append({
-                    "content": r.memory.content,
+                    "content": memory.content,
                     "score": r.combined_score,
                     "semantic_score": r.semantic_score,
                     "importance_score": r.importance_score,
                     "freshness_score": r.freshness_score,
-                    "memory_type": r.memory.memory_type,
-                    "memory_category": r.memory.memory_category,
-                    "importance": r.memory.importance,
+                    "memory_type": memory.memory_type,
+                    "memory_category": memory.memory_category,
+                    "importance": memory.importance,
                     # Warmth info
                     "warmth_boost": warmth,
                     "retrieval_warmth": entry.retrieval_warmth if entry else 0.0,
@@ -17,6 +17,10 @@ from core.logger import log_info, log_warning, log_error
 
 _client = None
 
+# *action* blocks (single asterisks only, so **bold** survives)
+_ACTION_RE = re.compile(r'(?<!\*)\*(?!\*)([^*]+)\*(?!\*)')
+_MULTI_SPACE_RE = re.compile(r'  +')
+
 
 def _get_client():
     """Lazy-load OpenAI client."""
@@ -46,14 +50,13 @@ def sanitize_for_tts(text: str) -> str:
     Note: **bold** text (double asterisks) is preserved.
     """
     # Remove *action* blocks (but not **bold**)
-    pattern = r'(?<!\*)\*(?!\*)([^*]+)\*(?!\*)'
-    sanitized = re.sub(pattern, '', text)
+    sanitized = _ACTION_RE.sub('', text)
 
     # Remove temporal context marker the LLM may echo
     sanitized = sanitized.replace("(Just now)", "")
 
     # Clean up any double spaces left behind
-    sanitized = re.sub(r'  +', ' ', sanitized)
+    sanitized = _MULTI_SPACE_RE.sub(' ', sanitized)
     return sanitized.strip()
 
 
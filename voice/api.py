@@ -7,7 +7,7 @@ Endpoints for ESP32-S3 Push-to-Talk integration:
   GET  /voice/health      - Pipeline status check
 """
 
-import queue
+from collections import deque
 from datetime import datetime
 
 from fastapi import APIRouter, Request, HTTPException
@@ -19,9 +19,10 @@ from core.user_settings import get_user_settings
 
 voice_router = APIRouter(prefix="/voice", tags=["voice"])
 
-# Thread-safe queue for GUI to pick up voice transcripts.
-# The GUI polls this queue on a QTimer to display voice turns in the chat.
-voice_event_queue = queue.Queue()
+# Voice transcripts waiting to be shown in the chat. The web server polls
+# this and pops events off the left; deque append/popleft are atomic, so
+# it needs none of queue.Queue's locking.
+voice_event_queue: deque = deque()
 
 
 @voice_router.get("/health")
@@ -167,7 +168,7 @@ async def voice_talk(request: Request):
         return JSONResponse({"error": str(e), "transcription": user_text}, status_code=500)
 
     # Notify GUI of the voice exchange (non-blocking)
-    voice_event_queue.put({
+    voice_event_queue.append({
         "user_text": user_text,
         "isaac_text": isaac_text,
         "timestamp": datetime.now().isoformat(),